@@ -0,0 +1,98 @@
+import argparse
+import gc
+import os
+import tempfile
+import tracemalloc
+from dataclasses import dataclass
+from typing import Dict, List
+from benchmarks.synthetic import write_xmi_model
+from src.model import ModelBuilder, Builder
+from src.parser import StreamingXmlConfigParser
+
+
+@dataclass
+class LegacyAttribute:
+    name: str
+    type: str
+
+
+@dataclass
+class LegacyRelation:
+    source: str
+    target: str
+    source_multiplicity: str
+    target_multiplicity: str
+
+
+@dataclass
+class LegacyClassInfo:
+    name: str
+    is_root: bool
+    documentation: str
+    attributes: List[LegacyAttribute]
+    source_relations: List[LegacyRelation]
+    target_relations: List[LegacyRelation]
+
+
+class LegacyBuilder(ModelBuilder):
+    def __init__(self):
+        self.classes: Dict[str, LegacyClassInfo] = {}
+        self.relations: List[LegacyRelation] = []
+    
+    def add_class(self, name: str, is_root: bool, documentation: str) -> 'LegacyBuilder':
+        if name not in self.classes:
+            self.classes[name] = LegacyClassInfo(name, is_root, documentation, [], [], [])
+        return self
+    
+    def add_attribute(self, class_name: str, attr_name: str, attr_type: str) -> 'LegacyBuilder':
+        if class_name in self.classes:
+            self.classes[class_name].attributes.append(LegacyAttribute(attr_name, attr_type))
+        return self
+    
+    def add_relation(self, source: str, target: str, source_multiplicity: str,
+                     target_multiplicity: str) -> 'LegacyBuilder':
+        relation = LegacyRelation(source, target, source_multiplicity, target_multiplicity)
+        self.relations.append(relation)
+        if source in self.classes:
+            self.classes[source].target_relations.append(relation)
+        if target in self.classes:
+            self.classes[target].source_relations.append(relation)
+        return self
+    
+    def build(self) -> Dict:
+        return {'classes': self.classes, 'relations': self.relations}
+
+
+def retained_size(builder: ModelBuilder, input_path: str) -> int:
+    gc.collect()
+    tracemalloc.start()
+    StreamingXmlConfigParser().parse_into(input_path, builder)
+    model = builder.build()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del model
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark retained memory of the built model")
+    parser.add_argument("--classes", type=int, default=200000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--attributes", type=int, default=4)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        input_path = os.path.join(tmp_dir, "model.xml")
+        write_xmi_model(input_path, args.classes, args.fanout, args.attributes)
+        legacy = retained_size(LegacyBuilder(), input_path)
+        compact = retained_size(Builder(), input_path)
+    
+    print(f"classes={args.classes} fanout={args.fanout} attributes={args.attributes}")
+    print(f"dataclass layout        {legacy / 1e6:8.1f} MB  {legacy / args.classes:6.0f} B/class")
+    print(f"slotted + interned      {compact / 1e6:8.1f} MB  {compact / args.classes:6.0f} B/class")
+    print(f"reduction               {100 * (1 - compact / legacy):8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import argparse
+import json
+import os
+import time
+from benchmarks.synthetic import build_config_pair
+from src.processor import ConfigComparator, ShardedConfigComparator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark sharded comparison of large flat configs")
+    parser.add_argument("--keys", type=int, default=2000000)
+    parser.add_argument("--change-ratio", type=float, default=0.1)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--shards-per-worker", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", metavar="PATH", help="write the measurements as JSON to PATH")
+    args = parser.parse_args()
+    
+    started = time.perf_counter()
+    original, patched = build_config_pair(args.keys, change_ratio=args.change_ratio)
+    print(f"generated {args.keys} keys in {time.perf_counter() - started:.1f} s, {os.cpu_count()} CPUs available")
+    
+    def measure(comparator: ConfigComparator) -> tuple:
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            delta = comparator.compare_configs(original, patched)
+            timings.append(time.perf_counter() - started)
+        return min(timings), delta
+    
+    serial, expected = measure(ConfigComparator())
+    print(f"serial: {serial:.3f} s")
+    results = {"keys": args.keys, "cpus": os.cpu_count(), "serial": serial, "workers": {}}
+    for workers in args.workers:
+        comparator = ShardedConfigComparator(workers=workers, shards_per_worker=args.shards_per_worker, min_keys=0)
+        elapsed, delta = measure(comparator)
+        if delta != expected:
+            raise SystemExit(f"sharded delta with {workers} workers differs from the serial delta")
+        results["workers"][str(workers)] = elapsed
+        print(f"{workers:>3} workers: {elapsed:.3f} s, speedup {serial / elapsed:.2f}x")
+    
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,48 @@
+import argparse
+import json
+import os
+import resource
+import tempfile
+import time
+from benchmarks.synthetic import write_flat_config_pair
+from src.processor import ConfigComparator, StreamingConfigComparator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming comparison of large flat configs")
+    parser.add_argument("--keys", type=int, default=10000000)
+    parser.add_argument("--change-ratio", type=float, default=0.1)
+    parser.add_argument("--run-size", type=int, default=500000)
+    parser.add_argument("--in-memory", action="store_true", help="also time json.load + compare_configs")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        original_path = os.path.join(tmp_dir, "config.json")
+        patched_path = os.path.join(tmp_dir, "patched_config.json")
+        started = time.perf_counter()
+        write_flat_config_pair(original_path, patched_path, args.keys, args.change_ratio)
+        print(f"generated {args.keys} keys ({os.path.getsize(original_path) / 1e6:.1f} MB) "
+              f"in {time.perf_counter() - started:.1f} s")
+        
+        comparator = StreamingConfigComparator(run_size=args.run_size, tmp_dir=tmp_dir)
+        started = time.perf_counter()
+        counts = comparator.compare_files(original_path, patched_path, os.path.join(tmp_dir, "delta.json"),
+                                          os.path.join(tmp_dir, "res_patched_config.json"))
+        elapsed = time.perf_counter() - started
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+        print(f"streaming compare: {elapsed:.1f} s, {args.keys / elapsed:,.0f} keys/s, peak RSS {peak_rss:.0f} MB, {counts}")
+        
+        if args.in_memory:
+            started = time.perf_counter()
+            with open(original_path) as f:
+                original = json.load(f)
+            with open(patched_path) as f:
+                patched = json.load(f)
+            ConfigComparator().compare_configs(original, patched)
+            elapsed = time.perf_counter() - started
+            peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"in-memory compare: {elapsed:.1f} s, peak RSS {peak_rss:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
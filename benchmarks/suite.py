@@ -0,0 +1,203 @@
+import argparse
+import gc
+import io
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+from benchmarks.synthetic import write_xmi_model, build_config_pair
+from src.model import Builder, ModelDirector, XmlConfigVisitor, MetaJsonVisitor
+from src.output import XmlConfigOutputGenerator, ModelSnapshotOutputGenerator
+from src.parser import XmlConfigParser, SnapshotModelParser
+from src.processor import ConfigComparator, ConfigStore
+from src.serializer import PrettyJsonSerializer, CompactJsonSerializer
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+
+
+@dataclass
+class BenchmarkStage:
+    name: str
+    run: Callable[[Any], Any]
+    setup: Callable[[], Any] = lambda: None
+
+
+def measure(stage: BenchmarkStage, repeats: int) -> Dict[str, float]:
+    timings = []
+    for _ in range(repeats):
+        arg = stage.setup()
+        gc.collect()
+        started = time.perf_counter()
+        stage.run(arg)
+        timings.append(time.perf_counter() - started)
+    
+    arg = stage.setup()
+    gc.collect()
+    tracemalloc.start()
+    stage.run(arg)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": min(timings), "median": statistics.median(timings), "peak_bytes": peak}
+
+
+def build_stages(tmp_dir: str, args: argparse.Namespace) -> List[BenchmarkStage]:
+    model_path = os.path.join(tmp_dir, "model.xml")
+    write_xmi_model(model_path, args.classes, args.fanout, args.attributes, args.depth)
+    original, patched = build_config_pair(args.keys, args.nesting, args.change_ratio, args.seed)
+    
+    model_data = XmlConfigParser().parse(model_path)
+    builder = Builder()
+    ModelDirector(builder).construct(model_data)
+    model = builder.build()
+    snapshot_path = os.path.join(tmp_dir, "model.mpsnap")
+    ModelSnapshotOutputGenerator().write(model, snapshot_path)
+    generator = XmlConfigOutputGenerator()
+    comparator = ConfigComparator()
+    serializer = PrettyJsonSerializer()
+    compact_serializer = CompactJsonSerializer()
+    delta = comparator.compare_configs(original, patched)
+    stores = []
+    for name, config in (("original", original), ("patched", patched)):
+        store_path = os.path.join(tmp_dir, name + ConfigStore.SUFFIX)
+        ConfigStore.write(config.items(), store_path)
+        stores.append(ConfigStore(store_path))
+    
+    def construct(_):
+        director_builder = Builder()
+        ModelDirector(director_builder).construct(model_data)
+        return director_builder.build()
+    
+    def indented_tree():
+        config_xml = XmlConfigVisitor().generate(model)
+        generator.indent(config_xml)
+        return config_xml
+    
+    def write_file(writer: Callable[[io.TextIOBase], None]) -> None:
+        with open(os.path.join(tmp_dir, "output"), "w", encoding="utf-8", newline="\n") as f:
+            writer(f)
+    
+    return [
+        BenchmarkStage("parse", lambda _: XmlConfigParser().parse(model_path)),
+        BenchmarkStage("construct", construct),
+        BenchmarkStage("snapshot_load", lambda _: SnapshotModelParser().parse_into(snapshot_path, Builder()).build()),
+        BenchmarkStage("xml_visitor", lambda _: XmlConfigVisitor().generate(model)),
+        BenchmarkStage("indent", generator.indent, lambda: XmlConfigVisitor().generate(model)),
+        BenchmarkStage("xml_write", lambda tree: write_file(lambda f: generator.write(tree, f)), indented_tree),
+        BenchmarkStage("meta_visitor", lambda _: MetaJsonVisitor().generate(model)),
+        BenchmarkStage("meta_dump", lambda meta: write_file(lambda f: serializer.dump(meta, f)),
+                       lambda: MetaJsonVisitor().generate(model)),
+        BenchmarkStage("compare_configs", lambda _: comparator.compare_configs(original, patched)),
+        BenchmarkStage("store_diff", lambda _: comparator.compare_stores(*stores)),
+        BenchmarkStage("apply_delta", lambda _: comparator.apply_delta(original, delta)),
+        BenchmarkStage("apply_delta_in_place", lambda config: comparator.apply_delta(config, delta, in_place=True),
+                       lambda: original.copy()),
+        BenchmarkStage("overlay_dump", lambda _: write_file(
+            lambda f: serializer.dump(comparator.overlay(original, delta), f))),
+        BenchmarkStage("delta_dump", lambda _: write_file(lambda f: serializer.dump(delta, f))),
+        BenchmarkStage("patched_dump", lambda _: write_file(lambda f: serializer.dump(patched, f))),
+        BenchmarkStage("patched_dump_compact", lambda _: write_file(lambda f: compact_serializer.dump(patched, f)))
+    ]
+
+
+def run_suite(args: argparse.Namespace) -> Dict:
+    params = {name: getattr(args, name) for name in
+              ("classes", "fanout", "depth", "attributes", "keys", "nesting", "change_ratio", "seed", "repeats")}
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for stage in build_stages(tmp_dir, args):
+            if args.stages and stage.name not in args.stages:
+                continue
+            results[stage.name] = measure(stage, args.repeats)
+            print(f"{stage.name:16s} {results[stage.name]['seconds']:9.4f} s  "
+                  f"peak {results[stage.name]['peak_bytes'] / 1e6:9.1f} MB")
+    return {
+        "params": params,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "stages": results
+    }
+
+
+def compare_with_baseline(results: Dict, baseline: Dict, time_tolerance: float,
+                          memory_tolerance: float, min_seconds: float = 0.0) -> List[str]:
+    if baseline.get("params") != results["params"]:
+        print("warning: baseline was recorded with different parameters, ratios are not comparable")
+    
+    regressions = []
+    print(f"{'stage':16s} {'baseline':>10s} {'current':>10s} {'ratio':>7s} {'peak ratio':>10s}")
+    for name, current in results["stages"].items():
+        previous = baseline.get("stages", {}).get(name)
+        if previous is None:
+            print(f"{name:16s} {'-':>10s} {current['seconds']:10.4f}")
+            continue
+        ratio = current["seconds"] / previous["seconds"] if previous["seconds"] else 1.0
+        peak_ratio = current["peak_bytes"] / previous["peak_bytes"] if previous["peak_bytes"] else 1.0
+        flags = []
+        if ratio > 1 + time_tolerance and current["seconds"] >= min_seconds:
+            flags.append("SLOWER")
+        if peak_ratio > 1 + memory_tolerance:
+            flags.append("MORE MEMORY")
+        print(f"{name:16s} {previous['seconds']:10.4f} {current['seconds']:10.4f} {ratio:7.2f} {peak_ratio:10.2f} "
+              f"{' '.join(flags)}")
+        if flags:
+            regressions.append(f"{name}: {', '.join(flags).lower()} (time x{ratio:.2f}, peak x{peak_ratio:.2f})")
+    return regressions
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Time each pipeline stage on synthetic inputs and "
+                                                 "compare against a stored baseline")
+    parser.add_argument("--classes", type=int, default=20000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--depth", type=int, default=None, help="maximum number of nesting levels in the model")
+    parser.add_argument("--attributes", type=int, default=4)
+    parser.add_argument("--keys", type=int, default=100000)
+    parser.add_argument("--nesting", type=int, default=0, help="levels of nested sections in the configs")
+    parser.add_argument("--change-ratio", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--stages", nargs="*", help="only run the named stages")
+    parser.add_argument("--output", metavar="PATH", help="write the results as JSON to PATH")
+    parser.add_argument("--baseline", metavar="PATH", default=DEFAULT_BASELINE)
+    parser.add_argument("--save-baseline", action="store_true", help="store the results as the new baseline")
+    parser.add_argument("--time-tolerance", type=float, default=0.3)
+    parser.add_argument("--memory-tolerance", type=float, default=0.1)
+    parser.add_argument("--min-seconds", type=float, default=0.01,
+                        help="do not report time regressions for stages faster than this")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    results = run_suite(args)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=4)
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=4)
+        print(f"baseline written to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}, run with --save-baseline to create one")
+        return 0
+    
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare_with_baseline(results, baseline, args.time_tolerance, args.memory_tolerance,
+                                        args.min_seconds)
+    for regression in regressions:
+        print(f"regression: {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,130 @@
+import json
+import random
+from typing import Dict, List, Optional, Tuple
+from xml.sax.saxutils import quoteattr
+from src.model import Builder
+
+
+def class_parents(classes: int, fanout: int = 8, depth: Optional[int] = None) -> List[int]:
+    if fanout <= 0:
+        raise ValueError(f"fanout must be positive, got {fanout}")
+    if depth is None:
+        return [-1] + [(idx - 1) // fanout for idx in range(1, classes)]
+    if depth < 2 and classes > 1:
+        raise ValueError(f"depth must be at least 2 for more than one class, got {depth}")
+    
+    parents = [-1]
+    levels = [0]
+    children = [0]
+    deepest_parents = [0] if depth == 2 else []
+    open_parent = 0
+    for idx in range(1, classes):
+        if idx < depth:
+            parent = idx - 1
+        else:
+            while open_parent < idx and (levels[open_parent] >= depth - 1 or children[open_parent] >= fanout):
+                open_parent += 1
+            if open_parent < idx:
+                parent = open_parent
+            else:
+                parent = deepest_parents[idx % len(deepest_parents)]
+        parents.append(parent)
+        levels.append(levels[parent] + 1)
+        children.append(0)
+        children[parent] += 1
+        if levels[idx] == depth - 2:
+            deepest_parents.append(idx)
+    return parents
+
+
+def class_name(idx: int) -> str:
+    return "Root" if idx == 0 else f"Class{idx}"
+
+
+def build_model(classes: int = 100000, fanout: int = 8, attributes: int = 4, depth: Optional[int] = None) -> Dict:
+    builder = Builder()
+    builder.add_class("Root", True, "Synthetic root class")
+    for idx in range(1, classes):
+        name = f"Class{idx}"
+        builder.add_class(name, False, f"Synthetic class {idx}")
+        for attr_idx in range(attributes):
+            builder.add_attribute(name, f"attr{attr_idx}", "uint32" if attr_idx % 2 else "string")
+    parents = class_parents(classes, fanout, depth)
+    for idx in range(1, classes):
+        builder.add_relation(f"Class{idx}", class_name(parents[idx]), "0..1", "1")
+    return builder.build()
+
+
+def write_xmi_model(path: str, classes: int = 100000, fanout: int = 8, attributes: int = 4,
+                    depth: Optional[int] = None) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('<?xml version="1.0" ?>\n<XMI xmi.version="1.1">\n')
+        f.write('    <Class name="Root" isRoot="true" documentation="Synthetic root class">\n    </Class>\n')
+        for idx in range(1, classes):
+            f.write(f'    <Class name="Class{idx}" isRoot="false" documentation={quoteattr(f"Synthetic class {idx}")}>\n')
+            for attr_idx in range(attributes):
+                attr_type = "uint32" if attr_idx % 2 else "string"
+                f.write(f'        <Attribute name="attr{attr_idx}" type="{attr_type}" />\n')
+            f.write("    </Class>\n")
+        parents = class_parents(classes, fanout, depth)
+        for idx in range(1, classes):
+            f.write(f'    <Aggregation source="Class{idx}" target="{class_name(parents[idx])}" '
+                    f'sourceMultiplicity="0..1" targetMultiplicity="1" />\n')
+        f.write("</XMI>\n")
+
+
+def write_flat_config_pair(original_path: str, patched_path: str, keys: int = 1000000,
+                           change_ratio: float = 0.1, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    with open(original_path, "w", encoding="utf-8") as original, open(patched_path, "w", encoding="utf-8") as patched:
+        original.write("{")
+        patched.write("{")
+        original_sep = patched_sep = "\n    "
+        for idx in range(keys):
+            key = json.dumps(f"param{idx}")
+            value = str(rng.randrange(1000))
+            original.write(f'{original_sep}{key}: "{value}"')
+            original_sep = ",\n    "
+            roll = rng.random()
+            if roll < change_ratio / 3:
+                continue
+            if roll < 2 * change_ratio / 3:
+                value = str(1000 + rng.randrange(1000))
+            patched.write(f'{patched_sep}{key}: "{value}"')
+            patched_sep = ",\n    "
+            if roll < change_ratio:
+                patched.write(f'{patched_sep}"added_param{idx}": "{rng.randrange(3000)}"')
+        original.write("\n}")
+        patched.write("\n}")
+
+
+def build_config_pair(keys: int = 100000, nesting: int = 0, change_ratio: float = 0.1,
+                      seed: int = 0, section_size: int = 16) -> Tuple[Dict, Dict]:
+    rng = random.Random(seed)
+    original = {}
+    patched = {}
+    for idx in range(keys):
+        path = [f"section{(idx // section_size ** (level + 1)) % section_size}" for level in range(nesting)]
+        value = rng.randrange(1000)
+        roll = rng.random()
+        new_value = value if roll >= 2 * change_ratio / 3 else 1000 + rng.randrange(1000)
+        
+        original_node = original
+        patched_node = patched
+        for part in path:
+            original_node = original_node.setdefault(part, {})
+            patched_node = patched_node.setdefault(part, {})
+        original_node[f"param{idx}"] = str(value)
+        if roll >= change_ratio / 3:
+            patched_node[f"param{idx}"] = str(new_value)
+        if roll < change_ratio:
+            patched_node[f"added_param{idx}"] = str(rng.randrange(3000))
+    return original, patched
+
+
+def write_config_pair(original_path: str, patched_path: str, keys: int = 100000, nesting: int = 0,
+                      change_ratio: float = 0.1, seed: int = 0) -> None:
+    original, patched = build_config_pair(keys, nesting, change_ratio, seed)
+    for path, config in ((original_path, original), (patched_path, patched)):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(config, f, indent=4)
\ No newline at end of file
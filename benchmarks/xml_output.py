@@ -0,0 +1,50 @@
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+from benchmarks.synthetic import build_model
+from src.config import AppConfiguration
+from src.output import XmlConfigOutputGenerator, StreamingXmlConfigOutputGenerator
+
+
+def measure(generator_cls, model, output_path: str):
+    config = AppConfiguration(output_paths={generator_cls.key(): output_path})
+    started = time.perf_counter()
+    generator_cls().generate(model, config)
+    elapsed = time.perf_counter() - started
+    
+    tracemalloc.start()
+    generator_cls().generate(model, config)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark config.xml generation: ElementTree vs streaming writer")
+    parser.add_argument("--classes", type=int, default=200000)
+    parser.add_argument("--fanout", type=int, default=8)
+    parser.add_argument("--attributes", type=int, default=4)
+    args = parser.parse_args()
+    
+    model = build_model(args.classes, args.fanout, args.attributes)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        results = {}
+        for generator_cls in (XmlConfigOutputGenerator, StreamingXmlConfigOutputGenerator):
+            output_path = os.path.join(tmp_dir, generator_cls.__name__ + ".xml")
+            results[generator_cls.__name__] = measure(generator_cls, model, output_path)
+        
+        paths = [os.path.join(tmp_dir, name + ".xml") for name in results]
+        with open(paths[0], "rb") as a, open(paths[1], "rb") as b:
+            identical = a.read() == b.read()
+        size = os.path.getsize(paths[0])
+    
+    print(f"classes={args.classes} fanout={args.fanout} attributes={args.attributes} output={size / 1e6:.1f} MB")
+    for name, (elapsed, peak) in results.items():
+        print(f"{name:40s} {elapsed:8.3f} s {size / elapsed / 1e6:8.1f} MB/s  peak {peak / 1e6:8.1f} MB")
+    print(f"identical output: {identical}")
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
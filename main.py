@@ -1,6 +1,131 @@
-from src.application import Application
+import argparse
+import sys
+from src.application import Application, ConcurrentApplication
+from src.batch import BatchRunner
+from src.instrumentation import Instrumentation
+from src.output import (XmlConfigOutputGenerator, MetaJsonOutputGenerator, IncrementalXmlConfigOutputGenerator,
+                        IncrementalMetaJsonOutputGenerator, ModelSnapshotOutputGenerator)
+from src.processor import (JsonConfigProcessor, ConfigStoreProcessor, ModelProcessor, ModelCache,
+                           ShardedConfigComparator)
+from src.serializer import CompactJsonSerializer
+from src.server import ProcessingServer, ProcessingService, parse_address
+from src.watcher import PipelineWatcher, WatchRun
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Model processing application")
+    parser.add_argument("--batch", metavar="MANIFEST", help="run the jobs listed in a JSON batch manifest")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes for batch mode")
+    parser.add_argument("--report", metavar="PATH", help="write the batch summary report to PATH")
+    parser.add_argument("--concurrent", action="store_true",
+                        help="overlap config processing with model parsing and run generators in parallel")
+    parser.add_argument("--incremental", action="store_true",
+                        help="reuse cached output fragments and only re-render classes changed since the previous run")
+    parser.add_argument("--verify-incremental", action="store_true",
+                        help="with --incremental, compare every incremental output against a full rebuild")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and regenerate outputs whenever the input model or configs change")
+    parser.add_argument("--poll-interval", type=float, default=0.5, help="seconds between input checks in watch mode")
+    parser.add_argument("--compact-json", action="store_true",
+                        help="write meta.json and the config outputs without indentation using the fastest encoder")
+    parser.add_argument("--config-store", metavar="DIR",
+                        help="compile the input configs into memory-mapped sorted stores in DIR and diff those")
+    parser.add_argument("--model-cache", metavar="DIR",
+                        help="cache parsed models as binary snapshots in DIR, keyed by the input file contents")
+    parser.add_argument("--model-cache-max-bytes", type=int, default=256 * 1024 * 1024, metavar="N",
+                        help="with --model-cache, evict the least recently used snapshots above N bytes")
+    parser.add_argument("--compare-workers", type=int, metavar="N",
+                        help="compare large configs in N worker processes, each handling a shard of the keys")
+    parser.add_argument("--convert-model", nargs=2, metavar=("INPUT", "OUTPUT"),
+                        help="parse a model in any supported format and write it as a binary snapshot "
+                             "(.gz/.xz/.zst suffixes compress the output)")
+    parser.add_argument("--serve", metavar="HOST:PORT",
+                        help="keep a warm pipeline in memory and serve POST /process requests over HTTP")
+    parser.add_argument("--metrics", metavar="PATH",
+                        help="record per-stage timings and counts; .prom/.txt writes Prometheus text, otherwise JSON")
+    parser.add_argument("--trace-memory", action="store_true", help="with --metrics, also record peak allocations")
+    parser.add_argument("--profile-stage", metavar="NAME", help="capture a cProfile of the named stage")
+    parser.add_argument("--profile-output", metavar="PATH", default="stage.prof",
+                        help="where to write the --profile-stage capture")
+    args = parser.parse_args()
+    if args.compare_workers and args.config_store:
+        parser.error("--compare-workers cannot be combined with --config-store, which diffs the stores serially")
+    if args.compare_workers and args.serve:
+        parser.error("--compare-workers cannot be combined with --serve: server threads always compare serially")
+    return args
+
+
+def write_metrics(instrumentation: Instrumentation, path: str) -> None:
+    if instrumentation and path:
+        instrumentation.write(path)
+
+
+def report_watch_run(run: WatchRun) -> None:
+    stages = "+".join(run.stages)
+    if run.error:
+        print(f"[{stages}] {'+'.join(run.failed)} failed after {run.elapsed:.3f}s: {run.error}")
+    else:
+        print(f"[{stages}] regenerated in {run.elapsed:.3f}s")
 
 
 if __name__ == "__main__":
-    app = Application()
-    app.run()
\ No newline at end of file
+    args = parse_args()
+    if args.batch:
+        report = BatchRunner(max_workers=args.workers).run_manifest(args.batch, args.report)
+        print(f"Batch finished: {report['succeeded']}/{report['total']} succeeded, {report['failed']} failed")
+        sys.exit(1 if report["failed"] else 0)
+    model_cache = ModelCache(args.model_cache, args.model_cache_max_bytes) if args.model_cache else None
+    model_processor = ModelProcessor(cache=model_cache)
+    if args.convert_model:
+        model = model_processor.process_model(args.convert_model[0])
+        ModelSnapshotOutputGenerator().write(model, args.convert_model[1])
+        print(f"Wrote {len(model['classes'])} classes to {args.convert_model[1]}")
+        sys.exit(0)
+    serializer = CompactJsonSerializer() if args.compact_json else None
+    output_generators = None
+    if args.incremental or args.watch:
+        output_generators = [
+            IncrementalXmlConfigOutputGenerator(verify=args.verify_incremental),
+            IncrementalMetaJsonOutputGenerator(verify=args.verify_incremental, serializer=serializer)
+        ]
+    elif serializer:
+        output_generators = [XmlConfigOutputGenerator(), MetaJsonOutputGenerator(serializer=serializer)]
+    config_processor = JsonConfigProcessor(serializer) if serializer else None
+    if args.config_store:
+        config_processor = ConfigStoreProcessor(args.config_store, serializer)
+    instrumentation = None
+    if args.metrics or args.profile_stage:
+        instrumentation = Instrumentation(trace_memory=args.trace_memory, profile_stage=args.profile_stage,
+                                          profile_path=args.profile_output)
+    app_class = ConcurrentApplication if args.concurrent else Application
+    config_comparator = ShardedConfigComparator(workers=args.compare_workers) if args.compare_workers else None
+    app = app_class(output_generators=output_generators, config_processor=config_processor,
+                    model_processor=model_processor, config_comparator=config_comparator,
+                    instrumentation=instrumentation)
+    if args.serve:
+        server = ProcessingServer(parse_address(args.serve), ProcessingService(app))
+        print(f"Serving on http://{server.server_address[0]}:{server.server_address[1]}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            write_metrics(instrumentation, args.metrics)
+        sys.exit(0)
+    if args.watch:
+        def on_run(run: WatchRun) -> None:
+            report_watch_run(run)
+            write_metrics(instrumentation, args.metrics)
+        
+        watcher = PipelineWatcher(app, interval=args.poll_interval, on_run=on_run)
+        print(f"Watching {', '.join(watcher.watched)}")
+        try:
+            watcher.watch()
+        except KeyboardInterrupt:
+            pass
+        sys.exit(0)
+    try:
+        app.run()
+    finally:
+        write_metrics(instrumentation, args.metrics)
\ No newline at end of file
@@ -3,39 +3,131 @@ from typing import Dict, List, Optional
 from src.config import AppConfiguration
 from src.processor import ModelProcessor, ConfigComparator, ConfigProcessor, JsonConfigProcessor
 from src.output import OutputGenerator, XmlConfigOutputGenerator, MetaJsonOutputGenerator
+from src.pipeline import Stage, StageError, StageScheduler
+from src.instrumentation import NullInstrumentation, NULL_INSTRUMENTATION
+
+
+def generate_output(generator: OutputGenerator, config: AppConfiguration, model: Dict) -> None:
+    try:
+        generator.generate(model, config)
+    except IOError as e:
+        raise IOError(f"Failed to generate output files: {e}") from e
+    except KeyError as e:
+        raise ValueError(f"Output path not defined for generator: {e}") from e
+
+
+def process_configs(config_processor: ConfigProcessor, config: AppConfiguration, comparator: ConfigComparator) -> None:
+    config_processor.process(config, comparator)
+
+
+def instrumented(instrumentation: NullInstrumentation, name: str, func, *args):
+    with instrumentation.stage(name):
+        return func(*args)
+
+
+def instrumented_in_process(instrumentation: NullInstrumentation, name: str, func, *args) -> Dict:
+    try:
+        instrumented(instrumentation, name, func, *args)
+    except Exception as e:
+        e.stage_metrics = instrumentation.report()
+        raise
+    return instrumentation.report()
+
+
+class ApplicationError(Exception):
+    def __init__(self, stage: str, error: Exception):
+        super().__init__(f"Application execution failed in stage '{stage}': {error}")
+        self.stage = stage
+        self.error = error
 
 
 class Application:
     def __init__(self, config: AppConfiguration = None, output_generators: Optional[List[OutputGenerator]] = None,
-                 config_processor: Optional[ConfigProcessor] = None):
+                 config_processor: Optional[ConfigProcessor] = None, model_processor: Optional[ModelProcessor] = None,
+                 config_comparator: Optional[ConfigComparator] = None,
+                 instrumentation: Optional[NullInstrumentation] = None):
         self.config = config or AppConfiguration()
-        self.model_processor = ModelProcessor()
-        self.config_comparator = ConfigComparator()
+        self.model_processor = model_processor or ModelProcessor()
+        self.config_comparator = config_comparator or ConfigComparator()
         self.output_generators = output_generators or [
             XmlConfigOutputGenerator(),
             MetaJsonOutputGenerator()
         ]
         self.config_processor = config_processor or JsonConfigProcessor()
-        os.makedirs(self.config.output_dir, exist_ok=True)
+        self.instrumentation = instrumentation or NULL_INSTRUMENTATION
+        if instrumentation is not None:
+            for component in [self.model_processor, self.config_processor] + self.output_generators:
+                component.instrumentation = instrumentation
     
-    def generate_output_files(self, model: Dict) -> None:
-        try:
-            for generator in self.output_generators:
-                generator.generate(model, self.config)
-        except IOError as e:
-            raise IOError(f"Failed to generate output files: {e}") from e
-        except KeyError as e:
-            raise ValueError(f"Output path not defined for generator: {e}") from e
+    def generate_output_files(self, model: Dict, config: Optional[AppConfiguration] = None) -> None:
+        for generator in self.output_generators:
+            with self.instrumentation.stage(f"output.{type(generator).__name__}"):
+                generate_output(generator, config or self.config, model)
     
-    def process_configs(self) -> None:
-        self.config_processor.process(self.config, self.config_comparator)
+    def process_configs(self, config: Optional[AppConfiguration] = None) -> None:
+        with self.instrumentation.stage("configs"):
+            self.config_processor.process(config or self.config, self.config_comparator)
     
-    def run(self) -> None:
+    def run(self, config: Optional[AppConfiguration] = None) -> None:
+        config = config or self.config
+        os.makedirs(config.output_dir, exist_ok=True)
+        stage = "model"
         try:
-            model = self.model_processor.process_model(self.config.input_model)
-            self.generate_output_files(model)
-            self.process_configs()
+            with self.instrumentation.stage("model"):
+                model = self.model_processor.process_model(config.input_model)
+            stage = "output"
+            self.generate_output_files(model, config)
+            stage = "configs"
+            self.process_configs(config)
         except FileNotFoundError as e:
-            raise FileNotFoundError(f"Input model file not found: {e}") from e
+            if stage == "model":
+                raise FileNotFoundError(f"Input model file not found: {e}") from e
+            raise FileNotFoundError(f"Input file not found in stage '{stage}': {e}") from e
         except Exception as e:
-            raise Exception(f"Application execution failed: {e}") from e
\ No newline at end of file
+            raise ApplicationError(stage, e) from e
+
+
+class ConcurrentApplication(Application):
+    def __init__(self, config: AppConfiguration = None, output_generators: Optional[List[OutputGenerator]] = None,
+                 config_processor: Optional[ConfigProcessor] = None, model_processor: Optional[ModelProcessor] = None,
+                 config_comparator: Optional[ConfigComparator] = None, scheduler: Optional[StageScheduler] = None,
+                 configs_in_process: bool = True, generators_in_processes: bool = False,
+                 instrumentation: Optional[NullInstrumentation] = None):
+        super().__init__(config, output_generators, config_processor, model_processor, config_comparator,
+                         instrumentation)
+        self.scheduler = scheduler or StageScheduler()
+        self.configs_in_process = configs_in_process
+        self.generators_in_processes = generators_in_processes
+    
+    def stages(self, config: Optional[AppConfiguration] = None) -> List[Stage]:
+        config = config or self.config
+        configs_runner = instrumented_in_process if self.configs_in_process else instrumented
+        output_runner = instrumented_in_process if self.generators_in_processes else instrumented
+        stages = [
+            Stage("model", instrumented, (self.instrumentation, "model", self.model_processor.process_model,
+                                          config.input_model)),
+            Stage("configs", configs_runner, (self.instrumentation, "configs", process_configs, self.config_processor,
+                                              config, self.config_comparator), use_process=self.configs_in_process)
+        ]
+        for idx, generator in enumerate(self.output_generators):
+            stages.append(Stage(f"output:{idx}:{type(generator).__name__}", output_runner,
+                                (self.instrumentation, f"output.{type(generator).__name__}", generate_output,
+                                 generator, config), ("model",), self.generators_in_processes))
+        return stages
+    
+    def run(self, config: Optional[AppConfiguration] = None) -> None:
+        config = config or self.config
+        os.makedirs(config.output_dir, exist_ok=True)
+        stages = self.stages(config)
+        process_stages = [stage.name for stage in stages if stage.use_process]
+        try:
+            results = self.scheduler.run(stages)
+        except StageError as e:
+            for name in process_stages:
+                if name in e.results:
+                    self.instrumentation.merge(e.results[name])
+                elif hasattr(e.errors.get(name), "stage_metrics"):
+                    self.instrumentation.merge(e.errors[name].stage_metrics)
+            raise
+        for name in process_stages:
+            self.instrumentation.merge(results[name])
\ No newline at end of file
@@ -0,0 +1,94 @@
+import json
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from src.config import AppConfiguration
+from src.application import Application
+
+
+DEFAULT_OUTPUT_FILES = {
+    "XmlConfigOutputGenerator": "config.xml",
+    "MetaJsonOutputGenerator": "meta.json"
+}
+DEFAULT_OUTPUT_CONFIG_FILES = ["delta.json", "res_patched_config.json"]
+
+
+def job_configuration(job: Dict) -> AppConfiguration:
+    output_dir = job["output_dir"]
+    return AppConfiguration(
+        input_model=job["input_model"],
+        input_config_paths=job["input_config_paths"],
+        output_dir=output_dir,
+        output_paths=job.get("output_paths") or {
+            key: os.path.join(output_dir, name) for key, name in DEFAULT_OUTPUT_FILES.items()
+        },
+        output_config_paths=job.get("output_config_paths") or [
+            os.path.join(output_dir, name) for name in DEFAULT_OUTPUT_CONFIG_FILES
+        ]
+    )
+
+
+def run_job(job: Dict) -> Dict:
+    started = time.perf_counter()
+    result = {"name": job.get("name") or job.get("input_model"), "status": "ok", "error": None}
+    try:
+        Application(config=job_configuration(job)).run()
+    except Exception as e:
+        result["status"] = "failed"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+    result["elapsed"] = time.perf_counter() - started
+    return result
+
+
+class BatchRunner:
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is not None and max_workers <= 0:
+            raise ValueError(f"max_workers must be positive, got {max_workers}")
+        self.max_workers = max_workers
+    
+    def load_manifest(self, manifest_path: str) -> List[Dict]:
+        with open(manifest_path, "r") as f:
+            manifest = json.load(f)
+        jobs = manifest["jobs"] if isinstance(manifest, dict) else manifest
+        if not isinstance(jobs, list):
+            raise ValueError("Batch manifest must be a list of jobs or an object with a 'jobs' list")
+        for idx, job in enumerate(jobs):
+            missing = [k for k in ("input_model", "input_config_paths", "output_dir") if k not in job]
+            if missing:
+                raise ValueError(f"Batch job #{idx} is missing required fields: {', '.join(missing)}")
+        return jobs
+    
+    def run(self, jobs: List[Dict]) -> Dict:
+        started = time.perf_counter()
+        results: List[Dict] = []
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(run_job, job) for job in jobs]
+            for job, future in zip(jobs, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    results.append({
+                        "name": job.get("name") or job.get("input_model"),
+                        "status": "failed",
+                        "error": f"{type(e).__name__}: {e}",
+                        "elapsed": None
+                    })
+        
+        failed = sum(1 for r in results if r["status"] != "ok")
+        return {
+            "total": len(results),
+            "succeeded": len(results) - failed,
+            "failed": failed,
+            "elapsed": time.perf_counter() - started,
+            "jobs": results
+        }
+    
+    def run_manifest(self, manifest_path: str, report_path: Optional[str] = None) -> Dict:
+        report = self.run(self.load_manifest(manifest_path))
+        if report_path:
+            with open(report_path, "w") as f:
+                json.dump(report, f, indent=4)
+        return report
\ No newline at end of file
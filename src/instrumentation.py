@@ -0,0 +1,220 @@
+import cProfile
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterator, List, Optional
+
+
+@dataclass
+class StageMetrics:
+    name: str
+    calls: int = 0
+    errors: int = 0
+    wall_seconds: float = 0.0
+    cpu_seconds: float = 0.0
+    last_wall_seconds: float = 0.0
+    peak_bytes: Optional[int] = None
+    counts: Dict[str, int] = field(default_factory=dict)
+    
+    def count(self, name: str, value: int) -> None:
+        self.counts[name] = value
+
+
+class NullStage:
+    def count(self, name: str, value: int) -> None:
+        pass
+    
+    def __enter__(self) -> 'NullStage':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+
+class NullInstrumentation:
+    enabled = False
+    null_stage = NullStage()
+    
+    def stage(self, name: str) -> NullStage:
+        return self.null_stage
+    
+    def report(self) -> Dict:
+        return {"stages": {}}
+    
+    def merge(self, report: Dict) -> None:
+        pass
+
+
+class Instrumentation(NullInstrumentation):
+    enabled = True
+    
+    def __init__(self, trace_memory: bool = False, profile_stage: Optional[str] = None,
+                 profile_path: Optional[str] = None):
+        self.trace_memory = trace_memory
+        self.profile_stage = profile_stage
+        self.profile_path = profile_path
+        self.profile = None
+        self.metrics: Dict[str, StageMetrics] = {}
+        self.memory_frames: List[List] = []
+        self.started_tracing = False
+        self.lock = threading.Lock()
+        self.local = threading.local()
+    
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["metrics"] = {}
+        state["memory_frames"] = []
+        state["started_tracing"] = False
+        state["profile"] = None
+        del state["lock"], state["local"]
+        return state
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.lock = threading.Lock()
+        self.local = threading.local()
+    
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        with self.lock:
+            metrics = self.metrics.get(name)
+            if metrics is None:
+                metrics = self.metrics[name] = StageMetrics(name)
+        
+        memory = self._enter_memory() if self.trace_memory else None
+        profile = cProfile.Profile() if name == self.profile_stage else None
+        failed = False
+        wall_started = time.perf_counter()
+        cpu_started = time.thread_time()
+        if profile:
+            profile.enable()
+        try:
+            yield metrics
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            if profile:
+                profile.disable()
+            cpu = time.thread_time() - cpu_started
+            wall = time.perf_counter() - wall_started
+            peak = self._leave_memory(memory) if memory is not None else None
+            with self.lock:
+                metrics.calls += 1
+                metrics.errors += failed
+                metrics.wall_seconds += wall
+                metrics.cpu_seconds += cpu
+                metrics.last_wall_seconds = wall
+                if peak is not None:
+                    metrics.peak_bytes = max(metrics.peak_bytes or 0, peak)
+                if profile:
+                    self.profile = profile
+            if profile and self.profile_path:
+                profile.dump_stats(self.profile_path)
+    
+    def _enter_memory(self) -> List:
+        thread = threading.get_ident()
+        with self.lock:
+            if not self.memory_frames:
+                self.started_tracing = not tracemalloc.is_tracing()
+                if self.started_tracing:
+                    tracemalloc.start()
+            overlapped = False
+            for frame in self.memory_frames:
+                if frame[3] != thread:
+                    frame[2] = overlapped = True
+            stack = getattr(self.local, "memory", None)
+            if stack is None:
+                stack = self.local.memory = []
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            frame = [current, current, overlapped, thread]
+            stack.append(frame)
+            self.memory_frames.append(frame)
+            return frame
+    
+    def _leave_memory(self, frame: List) -> Optional[int]:
+        with self.lock:
+            stack = self.local.memory
+            peak = max(frame[1], tracemalloc.get_traced_memory()[1])
+            stack.pop()
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+            self.memory_frames = [active for active in self.memory_frames if active is not frame]
+            if not self.memory_frames and self.started_tracing:
+                tracemalloc.stop()
+                self.started_tracing = False
+            return None if frame[2] else peak - frame[0]
+    
+    def report(self) -> Dict:
+        with self.lock:
+            return {"stages": {name: asdict(metrics) for name, metrics in self.metrics.items()}}
+    
+    def merge(self, report: Dict) -> None:
+        with self.lock:
+            for name, values in report["stages"].items():
+                metrics = self.metrics.get(name)
+                if metrics is None:
+                    metrics = self.metrics[name] = StageMetrics(name)
+                metrics.calls += values["calls"]
+                metrics.errors += values["errors"]
+                metrics.wall_seconds += values["wall_seconds"]
+                metrics.cpu_seconds += values["cpu_seconds"]
+                metrics.last_wall_seconds = values["last_wall_seconds"]
+                if values["peak_bytes"] is not None:
+                    metrics.peak_bytes = max(metrics.peak_bytes or 0, values["peak_bytes"])
+                metrics.counts.update(values["counts"])
+    
+    def write_json(self, path: str) -> None:
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=4)
+    
+    def to_prometheus(self, prefix: str = "pipeline_stage") -> str:
+        stages = self.report()["stages"]
+        series = [
+            ("calls_total", "counter", "Number of times the stage ran", "calls"),
+            ("errors_total", "counter", "Number of times the stage raised", "errors"),
+            ("wall_seconds_total", "counter", "Wall-clock time spent in the stage", "wall_seconds"),
+            ("cpu_seconds_total", "counter", "CPU time of the calling thread spent in the stage", "cpu_seconds"),
+            ("last_wall_seconds", "gauge", "Wall-clock time of the most recent run", "last_wall_seconds"),
+            ("peak_bytes", "gauge", "Peak traced allocations above the stage start", "peak_bytes")
+        ]
+        lines = []
+        for suffix, metric_type, help_text, key in series:
+            values = [(name, metrics[key]) for name, metrics in stages.items() if metrics[key] is not None]
+            if not values:
+                continue
+            lines.append(f"# HELP {prefix}_{suffix} {help_text}")
+            lines.append(f"# TYPE {prefix}_{suffix} {metric_type}")
+            for name, value in values:
+                lines.append(f'{prefix}_{suffix}{{stage="{self._label(name)}"}} {value}')
+        
+        counts = [(name, key, value) for name, metrics in stages.items() for key, value in metrics["counts"].items()]
+        if counts:
+            lines.append(f"# HELP {prefix}_items Elements, keys or bytes handled by the most recent run")
+            lines.append(f"# TYPE {prefix}_items gauge")
+            for name, key, value in counts:
+                lines.append(f'{prefix}_items{{stage="{self._label(name)}",item="{self._label(key)}"}} {value}')
+        return "\n".join(lines) + "\n"
+    
+    def write_prometheus(self, path: str) -> None:
+        with open(path, "w") as f:
+            f.write(self.to_prometheus())
+    
+    def write(self, path: str) -> None:
+        if path.endswith((".prom", ".txt")):
+            self.write_prometheus(path)
+        else:
+            self.write_json(path)
+    
+    @staticmethod
+    def _label(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+NULL_INSTRUMENTATION = NullInstrumentation()
\ No newline at end of file
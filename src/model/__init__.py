@@ -1,9 +1,15 @@
 from .elements import ModelElement, Attribute, Relation, ClassInfo
+from .index import ModelIndex
 from .builder import ModelBuilder, Builder, ModelDirector
-from .visitor import ModelVisitor, XmlConfigVisitor, MetaJsonVisitor
+from .visitor import (ModelVisitor, ClassTreeVisitor, XmlConfigVisitor, XmlStreamConfigVisitor, XmlFragmentVisitor,
+                      MetaJsonVisitor, escape_xml_text, escape_xml_attrib)
+from .snapshot import ModelSnapshot
+from .diff import ModelSignature, ModelDiff
 
 __all__ = [
     'ModelElement', 'Attribute', 'Relation', 'ClassInfo',
-    'ModelBuilder', 'Builder', 'ModelDirector',
-    'ModelVisitor', 'XmlConfigVisitor', 'MetaJsonVisitor'
+    'ModelIndex', 'ModelBuilder', 'Builder', 'ModelDirector',
+    'ModelVisitor', 'ClassTreeVisitor', 'XmlConfigVisitor', 'XmlStreamConfigVisitor', 'XmlFragmentVisitor',
+    'MetaJsonVisitor',
+    'escape_xml_text', 'escape_xml_attrib', 'ModelSnapshot', 'ModelSignature', 'ModelDiff'
 ]
\ No newline at end of file
@@ -1,6 +1,12 @@
+import sys
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Optional
 from src.model.elements import ClassInfo, Attribute, Relation
+from src.model.index import ModelIndex
+
+def intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if type(value) is str else value
+
 
 class ModelBuilder(ABC):
     @abstractmethod
@@ -27,6 +33,7 @@ class Builder(ModelBuilder):
 
     def add_class(self, name: str, is_root: bool, documentation: str) -> 'Builder':
         if name not in self.classes:
+            name = intern(name)
             self.classes[name] = ClassInfo(
                 name=name,
                 is_root=is_root,
@@ -40,17 +47,17 @@ class Builder(ModelBuilder):
     def add_attribute(self, class_name: str, attr_name: str, attr_type: str) -> 'Builder':
         if class_name in self.classes:
             self.classes[class_name].attributes.append(
-                Attribute(name=attr_name, type=attr_type)
+                Attribute(name=intern(attr_name), type=intern(attr_type))
             )
         return self
 
     def add_relation(self, source: str, target: str, 
                     source_multiplicity: str, target_multiplicity: str) -> 'Builder':
         relation = Relation(
-            source=source,
-            target=target,
-            source_multiplicity=source_multiplicity,
-            target_multiplicity=target_multiplicity
+            source=intern(source),
+            target=intern(target),
+            source_multiplicity=intern(source_multiplicity),
+            target_multiplicity=intern(target_multiplicity)
         )
         self.relations.append(relation)
         
@@ -64,7 +71,8 @@ class Builder(ModelBuilder):
     def build(self) -> Dict:
         return {
             'classes': self.classes,
-            'relations': self.relations
+            'relations': self.relations,
+            'index': ModelIndex.build(self.classes)
         }
 
 
@@ -0,0 +1,95 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import Dict, List, Optional, Set, Tuple
+from src.model.elements import ClassInfo
+
+
+attribute_signature = attrgetter("name", "type")
+relation_signature = attrgetter("source", "target", "source_multiplicity", "target_multiplicity")
+
+
+def class_signature(class_info: ClassInfo) -> Tuple:
+    return (
+        class_info.is_root,
+        class_info.documentation,
+        tuple(map(attribute_signature, class_info.attributes)),
+        tuple(map(relation_signature, class_info.source_relations)),
+        tuple(map(relation_signature, class_info.target_relations))
+    )
+
+
+@dataclass
+class ModelSignature:
+    classes: Dict[str, Tuple]
+    relations: Counter
+    
+    @classmethod
+    def of(cls, model: Dict) -> 'ModelSignature':
+        return cls(
+            {name: class_signature(class_info) for name, class_info in model["classes"].items()},
+            Counter(map(relation_signature, model["relations"]))
+        )
+
+
+@dataclass
+class ModelDiff:
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    attributes: Dict[str, Dict[str, List[str]]] = field(default_factory=dict)
+    relations: Dict[str, List[Tuple]] = field(default_factory=lambda: {"added": [], "removed": []})
+    structural: bool = False
+    
+    @classmethod
+    def compute(cls, old: Optional[ModelSignature], new: ModelSignature) -> 'ModelDiff':
+        if old is None:
+            return cls(added=list(new.classes), structural=True)
+        
+        diff = cls()
+        for name, signature in new.classes.items():
+            previous = old.classes.get(name)
+            if previous is None:
+                diff.added.append(name)
+            elif previous != signature:
+                diff.changed.append(name)
+                diff.attributes[name] = cls._attribute_changes(previous[2], signature[2])
+                if previous[0] != signature[0] or previous[3:] != signature[3:]:
+                    diff.structural = True
+        diff.removed = [name for name in old.classes if name not in new.classes]
+        if not dict.__eq__(old.relations, new.relations):
+            diff.relations["added"] = list((new.relations - old.relations).elements())
+            diff.relations["removed"] = list((old.relations - new.relations).elements())
+        
+        if diff.added or diff.removed or diff.relations["added"] or diff.relations["removed"]:
+            diff.structural = True
+        elif list(old.classes) != list(new.classes):
+            diff.structural = True
+        return diff
+    
+    @property
+    def dirty(self) -> Set[str]:
+        return set(self.added) | set(self.changed)
+    
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed or self.structural)
+    
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added),
+            "removed": len(self.removed),
+            "changed": len(self.changed),
+            "relations_added": len(self.relations["added"]),
+            "relations_removed": len(self.relations["removed"])
+        }
+    
+    @staticmethod
+    def _attribute_changes(old: Tuple, new: Tuple) -> Dict[str, List[str]]:
+        old_types = dict(old)
+        new_types = dict(new)
+        return {
+            "added": [name for name in new_types if name not in old_types],
+            "removed": [name for name in old_types if name not in new_types],
+            "changed": [name for name, attr_type in new_types.items()
+                        if name in old_types and old_types[name] != attr_type]
+        }
\ No newline at end of file
@@ -7,12 +7,15 @@ if TYPE_CHECKING:
     from .visitor import ModelVisitor
 
 class ModelElement(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def accept(self, visitor: 'ModelVisitor') -> None:
         raise NotImplementedError
 
 @dataclass
 class Attribute(ModelElement):
+    __slots__ = ("name", "type")
     name: str
     type: str
     
@@ -21,6 +24,7 @@ class Attribute(ModelElement):
 
 @dataclass
 class Relation(ModelElement):
+    __slots__ = ("source", "target", "source_multiplicity", "target_multiplicity")
     source: str
     target: str
     source_multiplicity: str
@@ -31,6 +35,7 @@ class Relation(ModelElement):
 
 @dataclass
 class ClassInfo(ModelElement):
+    __slots__ = ("name", "is_root", "documentation", "attributes", "source_relations", "target_relations")
     name: str
     is_root: bool
     documentation: str
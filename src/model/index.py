@@ -0,0 +1,70 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from src.model.elements import ClassInfo
+
+
+@dataclass
+class ModelIndex:
+    root: Optional[ClassInfo]
+    children: Dict[str, List[str]]
+    parents: Dict[str, List[str]]
+    multiplicity: Dict[str, Tuple[str, str]]
+    topological_order: List[str]
+
+    @classmethod
+    def build(cls, classes: Dict[str, ClassInfo]) -> 'ModelIndex':
+        root = None
+        children: Dict[str, List[str]] = {}
+        parents: Dict[str, List[str]] = {name: [] for name in classes}
+        multiplicity: Dict[str, Tuple[str, str]] = {}
+        
+        for name, class_info in classes.items():
+            if root is None and class_info.is_root:
+                root = class_info
+            children[name] = [rel.source for rel in class_info.source_relations if rel.source in classes]
+            for child in children[name]:
+                parents[child].append(name)
+            multiplicity[name] = cls._parse_multiplicity(class_info)
+        
+        return cls(root, children, parents, multiplicity, cls._topological_order(children, parents))
+    
+    def descendants(self, name: str) -> List[str]:
+        found = []
+        seen = {name}
+        queue = deque(self.children.get(name, ()))
+        while queue:
+            child = queue.popleft()
+            if child in seen:
+                continue
+            seen.add(child)
+            found.append(child)
+            queue.extend(self.children[child])
+        return found
+    
+    @staticmethod
+    def _parse_multiplicity(class_info: ClassInfo) -> Tuple[str, str]:
+        if class_info.is_root or not class_info.target_relations:
+            return "1", "1"
+        mult = class_info.target_relations[0].source_multiplicity
+        if mult is not None and ".." in mult:
+            min_val, max_val = mult.split("..")
+            return min_val, max_val
+        return mult, mult
+    
+    @staticmethod
+    def _topological_order(children: Dict[str, List[str]], parents: Dict[str, List[str]]) -> List[str]:
+        in_degree = {name: len(class_parents) for name, class_parents in parents.items()}
+        queue = deque(name for name, degree in in_degree.items() if degree == 0)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            for child in children[name]:
+                in_degree[child] -= 1
+                if in_degree[child] == 0:
+                    queue.append(child)
+        if len(order) < len(in_degree):
+            ordered = set(order)
+            order.extend(name for name in in_degree if name not in ordered)
+        return order
\ No newline at end of file
@@ -0,0 +1,104 @@
+import struct
+import sys
+from array import array
+from typing import BinaryIO, Dict, List, Optional
+from src.model.builder import ModelBuilder
+
+
+class ModelSnapshot:
+    MAGIC = b"MPSNAP"
+    VERSION = 1
+    NONE_INDEX = 0xFFFFFFFF
+    HEADER = struct.Struct("<6sHIIQ")
+
+    def dump(self, model: Dict, f: BinaryIO) -> None:
+        strings: Dict[str, int] = {}
+        ints = array("I")
+
+        def index(value: Optional[str]) -> int:
+            if value is None:
+                return self.NONE_INDEX
+            idx = strings.get(value)
+            if idx is None:
+                idx = strings[value] = len(strings)
+            return idx
+
+        ints.append(len(model["classes"]))
+        for class_info in model["classes"].values():
+            ints.extend((index(class_info.name), int(class_info.is_root),
+                         index(class_info.documentation), len(class_info.attributes)))
+            for attr in class_info.attributes:
+                ints.extend((index(attr.name), index(attr.type)))
+
+        ints.append(len(model["relations"]))
+        for rel in model["relations"]:
+            ints.extend((index(rel.source), index(rel.target),
+                         index(rel.source_multiplicity), index(rel.target_multiplicity)))
+
+        lengths = array("I", (len(s) for s in strings))
+        blob = "".join(strings).encode("utf-8")
+        if sys.byteorder != "little":
+            lengths.byteswap()
+            ints.byteswap()
+
+        f.write(self.HEADER.pack(self.MAGIC, self.VERSION, len(lengths), len(ints), len(blob)))
+        f.write(lengths.tobytes())
+        f.write(ints.tobytes())
+        f.write(blob)
+
+    def load(self, f: BinaryIO, builder: ModelBuilder) -> ModelBuilder:
+        header = f.read(self.HEADER.size)
+        if len(header) != self.HEADER.size:
+            raise ValueError("Truncated model snapshot header")
+        magic, version, string_count, int_count, blob_size = self.HEADER.unpack(header)
+        if magic != self.MAGIC:
+            raise ValueError("Not a model snapshot")
+        if version != self.VERSION:
+            raise ValueError(f"Unsupported model snapshot version: {version}")
+
+        lengths = self._read_array(f, string_count)
+        ints = self._read_array(f, int_count)
+        blob = f.read(blob_size)
+        if len(blob) != blob_size:
+            raise ValueError("Truncated model snapshot")
+
+        text = blob.decode("utf-8")
+        strings: List[Optional[str]] = []
+        offset = 0
+        for length in lengths:
+            strings.append(text[offset:offset + length])
+            offset += length
+
+        def string(idx: int) -> Optional[str]:
+            return None if idx == self.NONE_INDEX else strings[idx]
+
+        pos = 0
+        class_count = ints[pos]
+        pos += 1
+        for _ in range(class_count):
+            name, is_root, documentation, attr_count = ints[pos:pos + 4]
+            pos += 4
+            class_name = string(name)
+            builder.add_class(class_name, bool(is_root), string(documentation))
+            for _ in range(attr_count):
+                builder.add_attribute(class_name, string(ints[pos]), string(ints[pos + 1]))
+                pos += 2
+
+        relation_count = ints[pos]
+        pos += 1
+        for _ in range(relation_count):
+            source, target, source_multiplicity, target_multiplicity = ints[pos:pos + 4]
+            pos += 4
+            builder.add_relation(string(source), string(target),
+                                 string(source_multiplicity), string(target_multiplicity))
+        return builder
+
+    def _read_array(self, f: BinaryIO, count: int) -> array:
+        values = array("I")
+        data = f.read(count * values.itemsize)
+        if len(data) != count * values.itemsize:
+            raise ValueError("Truncated model snapshot")
+        values.frombytes(data)
+        if sys.byteorder != "little":
+            values.byteswap()
+        return values
\ No newline at end of file
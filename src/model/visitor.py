@@ -1,8 +1,31 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Set, TextIO
 import xml.etree.ElementTree as ET
 from src.model.elements import ClassInfo, Attribute, Relation
 
+def escape_xml_text(text: str) -> str:
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def escape_xml_attrib(text: str) -> str:
+    text = escape_xml_text(text)
+    if '"' in text:
+        text = text.replace('"', "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
 class ModelVisitor(ABC):
     @abstractmethod
     def visit_class(self, class_info: ClassInfo) -> None:
@@ -17,18 +40,73 @@ class ModelVisitor(ABC):
         raise NotImplementedError
 
 
-class XmlConfigVisitor(ModelVisitor):
+class ClassTreeVisitor(ModelVisitor):
     def __init__(self):
-        self.root_element = None
-        self.current_element = self.root_element
-        self.element_stack = []
         self.visited_classes = set()
         self.model = None
-        self.temp_class_element = None
     
     def visit_class(self, class_info: 'ClassInfo') -> None:
         if class_info.name in self.visited_classes:
             return
+        self._enter_class(class_info)
+        
+        pending = [(class_info, self._sources(class_info))]
+        while pending:
+            current_info, sources = pending[-1]
+            source_class_info = self._next_unvisited(sources)
+            if source_class_info is None:
+                pending.pop()
+                self._leave_class(current_info)
+            else:
+                self._enter_class(source_class_info)
+                pending.append((source_class_info, self._sources(source_class_info)))
+    
+    @abstractmethod
+    def _enter_class(self, class_info: 'ClassInfo') -> None:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def _leave_class(self, class_info: 'ClassInfo') -> None:
+        raise NotImplementedError
+    
+    def _sources(self, class_info: 'ClassInfo') -> Iterator['ClassInfo']:
+        if not self.model:
+            return iter(())
+        classes = self.model['classes']
+        index = self.model.get('index')
+        if index is not None:
+            return (classes[name] for name in index.children[class_info.name])
+        return (classes[rel.source] for rel in class_info.source_relations if rel.source in classes)
+    
+    def _next_unvisited(self, sources: Iterator['ClassInfo']) -> Optional['ClassInfo']:
+        for source_class_info in sources:
+            if source_class_info.name not in self.visited_classes:
+                return source_class_info
+        return None
+    
+    def _find_root(self, model: Dict) -> Optional['ClassInfo']:
+        index = model.get("index")
+        if index is not None:
+            return index.root
+        return next((class_info for class_info in model["classes"].values() if class_info.is_root), None)
+    
+    def visit_relation(self, relation: 'Relation') -> None:
+        pass
+    
+    def reset(self) -> None:
+        self.visited_classes = set()
+        self.model = None
+
+
+class XmlConfigVisitor(ClassTreeVisitor):
+    def __init__(self):
+        super().__init__()
+        self.root_element = None
+        self.current_element = self.root_element
+        self.element_stack = []
+        self.temp_class_element = None
+    
+    def _enter_class(self, class_info: 'ClassInfo') -> None:
         self.visited_classes.add(class_info.name)
         
         if class_info.is_root:
@@ -41,14 +119,8 @@ class XmlConfigVisitor(ModelVisitor):
         
         for attr in class_info.attributes:
             attr.accept(self)
-        
-        if self.model:
-            for rel in class_info.source_relations:
-                source_class = rel.source
-                if source_class in self.model['classes'] and source_class not in self.visited_classes:
-                    source_class_info = self.model['classes'][source_class]
-                    source_class_info.accept(self)
-        
+    
+    def _leave_class(self, class_info: 'ClassInfo') -> None:
         if self.element_stack and not class_info.is_root:
             self.current_element = self.element_stack.pop()
     
@@ -56,24 +128,215 @@ class XmlConfigVisitor(ModelVisitor):
         attr_elem = ET.SubElement(self.current_element, attribute.name)
         attr_elem.text = attribute.type
     
-    def visit_relation(self, relation: 'Relation') -> None:
-        pass
+    def reset(self) -> None:
+        super().reset()
+        self.root_element = None
+        self.current_element = None
+        self.element_stack = []
     
     def generate(self, model: Dict) -> ET.Element:
-        self.visited_classes.clear()
+        self.reset()
         self.model = model
-        for class_info in model["classes"].values():
-            if class_info.is_root:
-                class_info.accept(self)
-                break
+        root_info = self._find_root(model)
+        if root_info is not None:
+            root_info.accept(self)
         if self.root_element is None:
             raise ValueError("No root class found in the model")
         return self.root_element
 
+class XmlStreamConfigVisitor(ClassTreeVisitor):
+    def __init__(self, indent_str: str = "  ", buffer_size: int = 65536):
+        super().__init__()
+        self.indent_str = indent_str
+        self.buffer_size = buffer_size
+        self.indent_depth = 0
+        self.indent = "\n"
+        self.open_tags = []
+        self.chunks = []
+        self.buffered = 0
+        self.stream = None
+    
+    def _enter_class(self, class_info: 'ClassInfo') -> None:
+        if class_info.is_root and self.open_tags:
+            raise ValueError(f"Root class {class_info.name} is nested inside {self.open_tags[0][0]}")
+        self.visited_classes.add(class_info.name)
+        
+        self._start_child()
+        self._write(f"<{class_info.name}")
+        self.open_tags.append([class_info.name, False])
+        
+        for attr in class_info.attributes:
+            attr.accept(self)
+    
+    def _leave_class(self, class_info: 'ClassInfo') -> None:
+        name, has_children = self.open_tags.pop()
+        if has_children:
+            self._write(f"{self._indent(len(self.open_tags))}</{name}>")
+            if not self.open_tags:
+                self._write("\n")
+        else:
+            self._write(" />")
+    
+    def visit_attribute(self, attribute: 'Attribute') -> None:
+        self._start_child()
+        if attribute.type:
+            self._write(f"<{attribute.name}>{escape_xml_text(attribute.type)}</{attribute.name}>")
+        else:
+            self._write(f"<{attribute.name} />")
+    
+    def _start_child(self) -> None:
+        if not self.open_tags:
+            return
+        parent = self.open_tags[-1]
+        if not parent[1]:
+            parent[1] = True
+            self._write(">")
+        self._write(self._indent(len(self.open_tags)))
+    
+    def _indent(self, depth: int) -> str:
+        if depth != self.indent_depth:
+            self.indent_depth = depth
+            self.indent = "\n" + self.indent_str * depth
+        return self.indent
+    
+    def _write(self, text: str) -> None:
+        self.chunks.append(text)
+        self.buffered += len(text)
+        if self.buffered >= self.buffer_size:
+            self._flush()
+    
+    def _flush(self) -> None:
+        self.stream.write("".join(self.chunks))
+        self.chunks.clear()
+        self.buffered = 0
+    
+    def reset(self) -> None:
+        super().reset()
+        self.open_tags = []
+        self.chunks = []
+        self.buffered = 0
+        self.stream = None
+    
+    def write(self, model: Dict, stream: TextIO) -> None:
+        self.reset()
+        self.model = model
+        self.stream = stream
+        
+        root_info = self._find_root(model)
+        if root_info is None:
+            raise ValueError("No root class found in the model")
+        try:
+            root_info.accept(self)
+            self._flush()
+        finally:
+            self.stream = None
+
+class XmlFragmentVisitor(ClassTreeVisitor):
+    def __init__(self, indent_str: str = "  "):
+        super().__init__()
+        self.indent_str = indent_str
+        self.indents = ["\n"]
+        self.open_tags = []
+        self.pieces = []
+        self.positions = {}
+        self.fragments = {}
+        self.previous = {}
+        self.dirty = set()
+        self.reused = 0
+    
+    def _enter_class(self, class_info: 'ClassInfo') -> None:
+        if class_info.is_root and self.open_tags:
+            raise ValueError(f"Root class {class_info.name} is nested inside {self.open_tags[0][0].name}")
+        self.visited_classes.add(class_info.name)
+        
+        if self.open_tags:
+            self.open_tags[-1][2] = True
+        self.open_tags.append([class_info, len(self.pieces), False])
+        self.pieces.append(None)
+    
+    def _leave_class(self, class_info: 'ClassInfo') -> None:
+        _, open_idx, has_class_children = self.open_tags.pop()
+        depth = len(self.open_tags)
+        fragment = self.previous.get(class_info.name)
+        if (fragment is None or class_info.name in self.dirty
+                or fragment[0] != depth or fragment[1] != has_class_children):
+            fragment = self._render(class_info, depth, has_class_children)
+        else:
+            self.reused += 1
+        
+        self.fragments[class_info.name] = fragment
+        self.positions[class_info.name] = (open_idx, len(self.pieces))
+        self.pieces[open_idx] = fragment[2]
+        self.pieces.append(fragment[3])
+    
+    def visit_attribute(self, attribute: 'Attribute') -> None:
+        pass
+    
+    def _render(self, class_info: 'ClassInfo', depth: int, has_class_children: bool) -> tuple:
+        name = class_info.name
+        prefix = self._indent(depth) if depth else ""
+        if not (has_class_children or class_info.attributes):
+            return depth, has_class_children, f"{prefix}<{name}", " />"
+        
+        child_indent = self._indent(depth + 1)
+        parts = [f"{prefix}<{name}>"]
+        for attr in class_info.attributes:
+            if attr.type:
+                parts.append(f"{child_indent}<{attr.name}>{escape_xml_text(attr.type)}</{attr.name}>")
+            else:
+                parts.append(f"{child_indent}<{attr.name} />")
+        close = f"{self._indent(depth)}</{name}>"
+        return depth, has_class_children, "".join(parts), close + "\n" if not depth else close
+    
+    def _indent(self, depth: int) -> str:
+        while len(self.indents) <= depth:
+            self.indents.append(self.indents[-1] + self.indent_str)
+        return self.indents[depth]
+    
+    def reset(self) -> None:
+        super().reset()
+        self.open_tags = []
+        self.pieces = []
+        self.positions = {}
+        self.fragments = {}
+        self.reused = 0
+    
+    def generate(self, model: Dict, dirty: Optional[Set[str]] = None) -> List[str]:
+        self.previous = self.fragments if dirty is not None else {}
+        self.dirty = dirty or set()
+        self.reset()
+        self.model = model
+        
+        root_info = self._find_root(model)
+        if root_info is None:
+            raise ValueError("No root class found in the model")
+        try:
+            root_info.accept(self)
+        finally:
+            self.previous = {}
+            self.dirty = set()
+        return self.pieces
+    
+    def patch(self, model: Dict, names: Iterable[str]) -> List[str]:
+        classes = model["classes"]
+        names = list(names)
+        for name in names:
+            position = self.positions.get(name)
+            if position is None:
+                continue
+            depth, has_class_children = self.fragments[name][:2]
+            fragment = self._render(classes[name], depth, has_class_children)
+            self.fragments[name] = fragment
+            self.pieces[position[0]] = fragment[2]
+            self.pieces[position[1]] = fragment[3]
+        self.reused = len(self.positions) - len(set(names) & self.positions.keys())
+        return self.pieces
+
 class MetaJsonVisitor(ModelVisitor):
     def __init__(self):
         self.meta_data = []
         self.current_class = None
+        self.index = None
     
     def visit_class(self, class_info: ClassInfo) -> None:
         min_max = self._get_multiplicity(class_info)
@@ -96,6 +359,9 @@ class MetaJsonVisitor(ModelVisitor):
         self.current_class["parameters"].append({"name": relation.source, "type": "class"})
     
     def _get_multiplicity(self, class_info: ClassInfo) -> Dict:
+        if self.index is not None and class_info.name in self.index.multiplicity:
+            min_val, max_val = self.index.multiplicity[class_info.name]
+            return {"min": min_val, "max": max_val}
         if class_info.is_root:
             return {"min": "1", "max": "1"}
         for rel in class_info.target_relations:
@@ -107,7 +373,14 @@ class MetaJsonVisitor(ModelVisitor):
             return {"min": min_val, "max": max_val}
         return {"min": "1", "max": "1"}
     
+    def reset(self) -> None:
+        self.meta_data = []
+        self.current_class = None
+        self.index = None
+    
     def generate(self, model: Dict) -> List:
+        self.reset()
+        self.index = model.get("index")
         for class_info in model["classes"].values():
             class_info.accept(self)
         return self.meta_data
\ No newline at end of file
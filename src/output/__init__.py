@@ -1,3 +1,8 @@
-from .generator import OutputGenerator, XmlConfigOutputGenerator, MetaJsonOutputGenerator
+from .generator import (OutputGenerator, XmlConfigOutputGenerator, StreamingXmlConfigOutputGenerator,
+                        MetaJsonOutputGenerator, IncrementalXmlConfigOutputGenerator,
+                        IncrementalMetaJsonOutputGenerator, IncrementalMismatchError,
+                        ModelSnapshotOutputGenerator)
 
-__all__ = ['OutputGenerator', 'XmlConfigOutputGenerator', 'MetaJsonOutputGenerator']
\ No newline at end of file
+__all__ = ['OutputGenerator', 'XmlConfigOutputGenerator', 'StreamingXmlConfigOutputGenerator', 'MetaJsonOutputGenerator',
+           'IncrementalXmlConfigOutputGenerator', 'IncrementalMetaJsonOutputGenerator', 'IncrementalMismatchError',
+           'ModelSnapshotOutputGenerator']
\ No newline at end of file
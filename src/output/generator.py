@@ -1,12 +1,22 @@
-import json
+import copy
+import io
+import os
+import threading
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, TextIO
 from src.config import AppConfiguration
-from src.model import ModelVisitor, XmlConfigVisitor, MetaJsonVisitor
+from src.instrumentation import NULL_INSTRUMENTATION
+from src.serializer import JsonSerializer, PrettyJsonSerializer
+from src.model import (ModelVisitor, XmlConfigVisitor, XmlStreamConfigVisitor, XmlFragmentVisitor, MetaJsonVisitor,
+                       ClassInfo, ModelSignature, ModelDiff, ModelSnapshot, escape_xml_text,
+                       escape_xml_attrib)
+from src.parser import open_output
 
 
 class OutputGenerator(ABC):
+    instrumentation = NULL_INSTRUMENTATION
+    
     @abstractmethod
     def generate(self, model: Dict, config: AppConfiguration) -> None:
         raise NotImplementedError
@@ -16,44 +26,232 @@ class XmlConfigOutputGenerator(OutputGenerator):
         self.visitor = visitor or XmlConfigVisitor()
     
     def generate(self, model: Dict, config: AppConfiguration) -> None:
-        config_xml = self.visitor.generate(model)
-        self.indent(config_xml)
+        with self.instrumentation.stage("xml.visit") as stage:
+            config_xml = copy.deepcopy(self.visitor).generate(model)
+            if self.instrumentation.enabled:
+                stage.count("elements", sum(1 for _ in config_xml.iter()))
+        with self.instrumentation.stage("xml.indent"):
+            self.indent(config_xml)
         
-        tree = ET.ElementTree(config_xml)
-        with open(config.output_paths[self.key()], "wb") as f:
-            tree.write(f, encoding='utf-8', xml_declaration=False, method='xml')
+        with self.instrumentation.stage("xml.write") as stage:
+            with open(config.output_paths[self.key()], "w", encoding="utf-8",
+                      errors="xmlcharrefreplace", newline="\n") as f:
+                self.write(config_xml, f)
+                if self.instrumentation.enabled:
+                    stage.count("bytes", f.tell())
     
     def indent(self, elem: ET.Element, level: int = 0, indent_str: str = "  ") -> None:
         i = "\n" + level * indent_str
         if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + indent_str
-            last_idx = len(elem) - 1
-            for idx, subelem in enumerate(elem):
-                self.indent(subelem, level + 1, indent_str)
-                if idx == last_idx:
-                    subelem.tail = i
-                else:
-                    subelem.tail = i + indent_str
             if not elem.tail:
                 elem.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+        elif level and (not elem.tail or not elem.tail.strip()):
+            elem.tail = i
+        
+        indents = [i]
+        pending = [(elem, 0)]
+        while pending:
+            elem, depth = pending.pop()
+            if not len(elem):
+                continue
+            while len(indents) <= depth + 1:
+                indents.append(indents[-1] + indent_str)
+            if not elem.text or not elem.text.strip():
+                elem.text = indents[depth + 1]
+            for subelem in elem:
+                subelem.tail = indents[depth + 1]
+                pending.append((subelem, depth + 1))
+            subelem.tail = indents[depth]
+    
+    def write(self, elem: ET.Element, f: TextIO) -> None:
+        write = f.write
+        pending = [(elem, False)]
+        while pending:
+            elem, closing = pending.pop()
+            if closing:
+                write(f"</{elem.tag}>")
+            else:
+                start = f"<{elem.tag}"
+                if elem.attrib:
+                    start += "".join(f' {key}="{escape_xml_attrib(value)}"' for key, value in elem.attrib.items())
+                text = elem.text
+                if text or len(elem):
+                    write(start + ">")
+                    if text:
+                        write(escape_xml_text(text))
+                    pending.append((elem, True))
+                    pending.extend((subelem, False) for subelem in reversed(elem))
+                    continue
+                write(start + " />")
+            if elem.tail:
+                write(escape_xml_text(elem.tail))
     
     @classmethod
     def key(cls) -> str:
         return "XmlConfigOutputGenerator"
 
+class StreamingXmlConfigOutputGenerator(XmlConfigOutputGenerator):
+    def __init__(self, visitor: XmlStreamConfigVisitor = None, buffer_size: int = 1024 * 1024):
+        super().__init__(visitor or XmlStreamConfigVisitor())
+        self.buffer_size = buffer_size
+    
+    def generate(self, model: Dict, config: AppConfiguration) -> None:
+        with open(config.output_paths[self.key()], "w", encoding="utf-8", errors="xmlcharrefreplace",
+                  newline="\n", buffering=self.buffer_size) as f:
+            with self.instrumentation.stage("xml.stream") as stage:
+                copy.deepcopy(self.visitor).write(model, f)
+                if self.instrumentation.enabled:
+                    stage.count("bytes", f.tell())
+
 class MetaJsonOutputGenerator(OutputGenerator):
-    def __init__(self, visitor: ModelVisitor = None):
+    def __init__(self, visitor: ModelVisitor = None, serializer: JsonSerializer = None):
         self.visitor = visitor or MetaJsonVisitor()
+        self.serializer = serializer or PrettyJsonSerializer()
+    
+    def generate(self, model: Dict, config: AppConfiguration) -> None:
+        with self.instrumentation.stage("meta.visit") as stage:
+            meta_json = copy.deepcopy(self.visitor).generate(model)
+            stage.count("entries", len(meta_json))
+        with self.instrumentation.stage("meta.dump") as stage:
+            with open(config.output_paths[self.key()], "w", encoding="utf-8") as f:
+                self.serializer.dump(meta_json, f)
+                if self.instrumentation.enabled:
+                    stage.count("bytes", f.tell())
+    
+    @classmethod
+    def key(cls) -> str:
+        return "MetaJsonOutputGenerator"
+
+class IncrementalMismatchError(Exception):
+    pass
+
+def first_difference(expected: str, actual: str) -> int:
+    for idx, (left, right) in enumerate(zip(expected, actual)):
+        if left != right:
+            return idx
+    return min(len(expected), len(actual))
+
+class IncrementalXmlConfigOutputGenerator(XmlConfigOutputGenerator):
+    def __init__(self, visitor: XmlFragmentVisitor = None, verify: bool = False):
+        super().__init__(visitor or XmlFragmentVisitor())
+        self.verify = verify
+        self.signature = None
+        self.last_diff = None
+        self.lock = threading.Lock()
     
     def generate(self, model: Dict, config: AppConfiguration) -> None:
-        meta_json = self.visitor.generate(model)
-        with open(config.output_paths[self.key()], "w") as f:
-            json.dump(meta_json, f, indent=4)
+        with self.lock:
+            with self.instrumentation.stage("xml.diff") as stage:
+                signature = ModelSignature.of(model)
+                diff = ModelDiff.compute(self.signature, signature)
+                for name, value in diff.summary().items():
+                    stage.count(name, value)
+            self.signature = None
+            with self.instrumentation.stage("xml.render") as stage:
+                if diff.structural:
+                    pieces = self.visitor.generate(model, diff.dirty)
+                else:
+                    pieces = self.visitor.patch(model, diff.changed)
+                stage.count("reused", self.visitor.reused)
+            self.signature = signature
+            self.last_diff = diff
+            
+            text = "".join(pieces)
+            expected = text
+            if self.verify:
+                with self.instrumentation.stage("xml.verify"):
+                    expected = self.full_rebuild(model)
+            with self.instrumentation.stage("xml.write") as stage:
+                with open(config.output_paths[self.key()], "w", encoding="utf-8",
+                          errors="xmlcharrefreplace", newline="\n") as f:
+                    f.write(expected)
+                    if self.instrumentation.enabled:
+                        stage.count("bytes", f.tell())
+            if expected != text:
+                self.signature = None
+                raise IncrementalMismatchError(
+                    f"Incremental {self.key()} output differs from a full rebuild "
+                    f"at offset {first_difference(expected, text)}")
+    
+    def full_rebuild(self, model: Dict) -> str:
+        config_xml = XmlConfigVisitor().generate(model)
+        self.indent(config_xml, indent_str=self.visitor.indent_str)
+        buffer = io.StringIO()
+        self.write(config_xml, buffer)
+        return buffer.getvalue()
+
+class IncrementalMetaJsonOutputGenerator(MetaJsonOutputGenerator):
+    def __init__(self, visitor: MetaJsonVisitor = None, verify: bool = False, serializer: JsonSerializer = None):
+        super().__init__(visitor, serializer)
+        self.verify = verify
+        self.signature = None
+        self.fragments = {}
+        self.last_diff = None
+        self.reused = 0
+        self.lock = threading.Lock()
+    
+    def generate(self, model: Dict, config: AppConfiguration) -> None:
+        with self.lock:
+            with self.instrumentation.stage("meta.diff") as stage:
+                signature = ModelSignature.of(model)
+                diff = ModelDiff.compute(self.signature, signature)
+                for name, value in diff.summary().items():
+                    stage.count(name, value)
+            dirty = diff.dirty
+            visitor = copy.deepcopy(self.visitor)
+            visitor.index = model.get("index")
+            
+            with self.instrumentation.stage("meta.render") as stage:
+                fragments = {}
+                self.reused = 0
+                for name, class_info in model["classes"].items():
+                    fragment = self.fragments.get(name) if name not in dirty else None
+                    if fragment is None:
+                        fragment = self._render(visitor, class_info)
+                    else:
+                        self.reused += 1
+                    fragments[name] = fragment
+                stage.count("reused", self.reused)
+            self.fragments = fragments
+            self.signature = signature
+            self.last_diff = diff
+            
+            text = self.serializer.join_items(list(fragments.values()))
+            expected = text
+            if self.verify:
+                with self.instrumentation.stage("meta.verify"):
+                    expected = self.serializer.dumps(copy.deepcopy(self.visitor).generate(model))
+            with self.instrumentation.stage("meta.write") as stage:
+                with open(config.output_paths[self.key()], "w", encoding="utf-8") as f:
+                    f.write(expected)
+                stage.count("bytes", len(expected))
+            if expected != text:
+                self.signature = None
+                self.fragments = {}
+                raise IncrementalMismatchError(
+                    f"Incremental {self.key()} output differs from a full rebuild "
+                    f"at offset {first_difference(expected, text)}")
+    
+    def _render(self, visitor: MetaJsonVisitor, class_info: ClassInfo) -> str:
+        visitor.meta_data = []
+        class_info.accept(visitor)
+        return self.serializer.dumps_item(visitor.meta_data[0])
+
+
+class ModelSnapshotOutputGenerator(OutputGenerator):
+    def __init__(self, snapshot: ModelSnapshot = None):
+        self.snapshot = snapshot or ModelSnapshot()
+    
+    def generate(self, model: Dict, config: AppConfiguration) -> None:
+        self.write(model, config.output_paths[self.key()])
+    
+    def write(self, model: Dict, path: str) -> None:
+        with self.instrumentation.stage("snapshot.write") as stage:
+            with open_output(path) as f:
+                self.snapshot.dump(model, f)
+            if self.instrumentation.enabled:
+                stage.count("bytes", os.path.getsize(path))
     
     @classmethod
     def key(cls) -> str:
-        return "MetaJsonOutputGenerator"
\ No newline at end of file
+        return "ModelSnapshotOutputGenerator"
\ No newline at end of file
@@ -1,4 +1,9 @@
-from .parser import ConfigParser, JsonConfigParser, XmlConfigParser
+from .parser import (PARSER_VERSION, ConfigParser, JsonConfigParser, XmlConfigParser, StreamingXmlConfigParser,
+                     StreamingJsonConfigParser, ModelDataBuilder, SnapshotModelParser)
+from .compression import open_input, open_output
+from .registry import ParserRegistry, default_registry
 from .factory import ConfigParserFactory
 
-__all__ = ['ConfigParser', 'JsonConfigParser', 'XmlConfigParser', 'ConfigParserFactory']
\ No newline at end of file
+__all__ = ['PARSER_VERSION', 'ConfigParser', 'JsonConfigParser', 'XmlConfigParser', 'StreamingXmlConfigParser',
+           'StreamingJsonConfigParser', 'ModelDataBuilder', 'SnapshotModelParser', 'open_input', 'open_output',
+           'ParserRegistry', 'default_registry', 'ConfigParserFactory']
\ No newline at end of file
@@ -0,0 +1,60 @@
+import gzip
+import io
+import lzma
+import os
+from typing import BinaryIO
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+GZIP_MAGIC = b"\x1f\x8b"
+XZ_MAGIC = b"\xfd7zXZ\x00"
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+COMPRESSION_SUFFIXES = (".gz", ".xz", ".zst")
+
+
+def compression_of(magic: bytes) -> str:
+    if magic.startswith(GZIP_MAGIC):
+        return ".gz"
+    if magic.startswith(XZ_MAGIC):
+        return ".xz"
+    if magic.startswith(ZSTD_MAGIC):
+        return ".zst"
+    return ""
+
+
+def strip_compression_suffix(file_path: str) -> str:
+    root, extension = os.path.splitext(file_path)
+    return root if extension in COMPRESSION_SUFFIXES else file_path
+
+
+def require_zstandard() -> None:
+    if zstandard is None:
+        raise ValueError("Reading or writing .zst files requires the 'zstandard' package")
+
+
+def open_input(file_path: str) -> BinaryIO:
+    with open(file_path, "rb") as f:
+        compression = compression_of(f.read(len(XZ_MAGIC)))
+    if compression == ".gz":
+        return gzip.open(file_path, "rb")
+    if compression == ".xz":
+        return lzma.open(file_path, "rb")
+    if compression == ".zst":
+        require_zstandard()
+        return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(file_path, "rb"), closefd=True))
+    return open(file_path, "rb")
+
+
+def open_output(file_path: str) -> BinaryIO:
+    extension = os.path.splitext(file_path)[1]
+    if extension == ".gz":
+        return gzip.open(file_path, "wb", compresslevel=6)
+    if extension == ".xz":
+        return lzma.open(file_path, "wb")
+    if extension == ".zst":
+        require_zstandard()
+        return zstandard.ZstdCompressor().stream_writer(open(file_path, "wb"), closefd=True)
+    return open(file_path, "wb")
\ No newline at end of file
@@ -1,11 +1,17 @@
-from src.parser.parser import ConfigParser, JsonConfigParser, XmlConfigParser
+from typing import Optional
+from src.parser.parser import ConfigParser
+from src.parser.registry import ParserRegistry, default_registry
 
 class ConfigParserFactory:
-    def __init__(self):
-        self.parsers = {
-            ".xml": XmlConfigParser(),
-            ".json": JsonConfigParser()
-        }
+    def __init__(self, registry: Optional[ParserRegistry] = None):
+        self.registry = registry or default_registry()
+        self.parsers = self.registry.extensions
     
     def create_parser(self, extension: str) -> ConfigParser:
-        return self.parsers.get(extension, XmlConfigParser())
\ No newline at end of file
+        parser = self.registry.for_extension(extension)
+        if parser is None:
+            raise ValueError(f"No parser registered for extension: {extension!r}")
+        return parser
+    
+    def detect(self, file_path: str) -> ConfigParser:
+        return self.registry.detect(file_path)
\ No newline at end of file
@@ -1,7 +1,15 @@
+import io
 import json
+import re
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
-from typing import Dict
+from json.decoder import scanstring
+from typing import Any, Dict, Iterator, List, Tuple
+from src.model.builder import ModelBuilder
+from src.model.snapshot import ModelSnapshot
+from src.parser.compression import open_input
+
+PARSER_VERSION = "1"
 
 
 class ConfigParser(ABC):
@@ -11,12 +19,13 @@ class ConfigParser(ABC):
 
 class JsonConfigParser(ConfigParser):
     def parse(self, file_path: str) -> Dict:
-        with open(file_path, 'r') as f:
+        with open_input(file_path) as f:
             return json.load(f)
 
 class XmlConfigParser(ConfigParser):
     def parse(self, file_path: str) -> Dict:
-        tree = ET.parse(file_path)
+        with open_input(file_path) as f:
+            tree = ET.parse(f)
         root = tree.getroot()
         model = {"classes": {}, "relations": []}
         
@@ -44,4 +53,205 @@ class XmlConfigParser(ConfigParser):
             model["classes"][relation["source"]]["target_relations"].append(relation)
             model["classes"][relation["target"]]["source_relations"].append(relation)
         
-        return model
\ No newline at end of file
+        return model
+
+class StreamingXmlConfigParser(ConfigParser):
+    def parse(self, file_path: str) -> Dict:
+        model = {"classes": {}, "relations": []}
+        for event in self.iter_events(file_path):
+            if event[0] == "class":
+                _, class_name, is_root, documentation = event
+                model["classes"][class_name] = {
+                    "is_root": is_root,
+                    "documentation": documentation,
+                    "attributes": [],
+                    "source_relations": [],
+                    "target_relations": []
+                }
+            elif event[0] == "attribute":
+                _, class_name, attr_name, attr_type = event
+                model["classes"][class_name]["attributes"].append({"name": attr_name, "type": attr_type})
+            else:
+                _, source, target, source_multiplicity, target_multiplicity = event
+                model["relations"].append({
+                    "source": source,
+                    "target": target,
+                    "source_multiplicity": source_multiplicity,
+                    "target_multiplicity": target_multiplicity
+                })
+        
+        for relation in model["relations"]:
+            model["classes"][relation["source"]]["target_relations"].append(relation)
+            model["classes"][relation["target"]]["source_relations"].append(relation)
+        
+        return model
+    
+    def parse_into(self, file_path: str, builder: ModelBuilder) -> ModelBuilder:
+        known_classes = set()
+        pending_relations: List[Tuple[str, str, str, str]] = []
+        
+        for event in self.iter_events(file_path):
+            if event[0] == "class":
+                _, class_name, is_root, documentation = event
+                known_classes.add(class_name)
+                builder.add_class(class_name, is_root, documentation)
+            elif event[0] == "attribute":
+                _, class_name, attr_name, attr_type = event
+                builder.add_attribute(class_name, attr_name, attr_type)
+            else:
+                relation = event[1:]
+                if pending_relations or relation[0] not in known_classes or relation[1] not in known_classes:
+                    pending_relations.append(relation)
+                else:
+                    builder.add_relation(*relation)
+        
+        for relation in pending_relations:
+            builder.add_relation(*relation)
+        return builder
+    
+    def iter_events(self, file_path: str) -> Iterator[Tuple]:
+        with open_input(file_path) as f:
+            yield from self._iter_events(f)
+    
+    def _iter_events(self, f: io.BufferedIOBase) -> Iterator[Tuple]:
+        root = None
+        tag_stack: List[str] = []
+        class_stack: List[str] = []
+        
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                parent_tag = tag_stack[-1] if tag_stack else None
+                tag_stack.append(elem.tag)
+                
+                if elem.tag == "Class":
+                    class_name = elem.get("name")
+                    class_stack.append(class_name)
+                    yield "class", class_name, elem.get("isRoot") == "true", elem.get("documentation") or ""
+                elif elem.tag == "Attribute" and parent_tag == "Class":
+                    yield "attribute", class_stack[-1], elem.get("name"), elem.get("type")
+                elif elem.tag == "Aggregation":
+                    yield ("relation", elem.get("source"), elem.get("target"),
+                           elem.get("sourceMultiplicity"), elem.get("targetMultiplicity"))
+            else:
+                tag_stack.pop()
+                if elem.tag == "Class":
+                    class_stack.pop()
+                elem.clear()
+                if len(tag_stack) == 1:
+                    root.clear()
+
+class StreamingJsonConfigParser(ConfigParser):
+    WHITESPACE = re.compile(r"[ \t\n\r]*")
+    TRUNCATION_MARGIN = 16
+    
+    def __init__(self, chunk_size: int = 1024 * 1024):
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+    
+    def parse(self, file_path: str) -> Dict:
+        return dict(self.iter_items(file_path))
+    
+    def iter_items(self, file_path: str) -> Iterator[Tuple[str, Any]]:
+        skip = self.WHITESPACE.match
+        scan_once = self.decoder.scan_once
+        with io.TextIOWrapper(open_input(file_path), encoding="utf-8") as f:
+            buffer = ""
+            pos = 0
+            read_size = self.chunk_size
+            eof = False
+            started = False
+            while True:
+                try:
+                    if not started:
+                        end = skip(buffer, pos).end()
+                        if buffer[end] != "{":
+                            raise json.JSONDecodeError("Expecting '{'", buffer, end)
+                        end = skip(buffer, end + 1).end()
+                        if buffer[end] == "}":
+                            return
+                        pos = end
+                        started = True
+                    
+                    while True:
+                        end = skip(buffer, pos).end()
+                        if buffer[end] != '"':
+                            raise json.JSONDecodeError("Expecting property name enclosed in double quotes", buffer, end)
+                        key, end = scanstring(buffer, end + 1)
+                        end = skip(buffer, end).end()
+                        if buffer[end] != ":":
+                            raise json.JSONDecodeError("Expecting ':' delimiter", buffer, end)
+                        value, end = scan_once(buffer, skip(buffer, end + 1).end())
+                        end = skip(buffer, end).end()
+                        separator = buffer[end]
+                        if separator not in ",}":
+                            raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)
+                        yield key, value
+                        pos = end + 1
+                        read_size = self.chunk_size
+                        if separator == "}":
+                            return
+                except (IndexError, StopIteration, json.JSONDecodeError) as e:
+                    if isinstance(e, StopIteration) and not self._truncated(buffer, e.value):
+                        raise json.JSONDecodeError("Expecting value", buffer, e.value) from None
+                    if isinstance(e, json.JSONDecodeError) and (eof or not self._truncated(buffer, e.pos, e.msg)):
+                        raise
+                    if eof:
+                        raise json.JSONDecodeError("Unexpected end of JSON document", buffer, pos) from None
+                    chunk = f.read(read_size)
+                    eof = not chunk
+                    buffer = buffer[pos:] + chunk
+                    pos = 0
+                    read_size *= 2
+    
+    def _truncated(self, buffer: str, pos: int, msg: str = "") -> bool:
+        return msg.startswith("Unterminated string") or pos >= len(buffer) - self.TRUNCATION_MARGIN
+
+class ModelDataBuilder(ModelBuilder):
+    def __init__(self):
+        self.model = {"classes": {}, "relations": []}
+    
+    def add_class(self, name: str, is_root: bool, documentation: str) -> 'ModelDataBuilder':
+        self.model["classes"].setdefault(name, {
+            "is_root": is_root,
+            "documentation": documentation,
+            "attributes": [],
+            "source_relations": [],
+            "target_relations": []
+        })
+        return self
+    
+    def add_attribute(self, class_name: str, attr_name: str, attr_type: str) -> 'ModelDataBuilder':
+        if class_name in self.model["classes"]:
+            self.model["classes"][class_name]["attributes"].append({"name": attr_name, "type": attr_type})
+        return self
+    
+    def add_relation(self, source: str, target: str, source_multiplicity: str,
+                     target_multiplicity: str) -> 'ModelDataBuilder':
+        relation = {
+            "source": source,
+            "target": target,
+            "source_multiplicity": source_multiplicity,
+            "target_multiplicity": target_multiplicity
+        }
+        self.model["relations"].append(relation)
+        if source in self.model["classes"]:
+            self.model["classes"][source]["target_relations"].append(relation)
+        if target in self.model["classes"]:
+            self.model["classes"][target]["source_relations"].append(relation)
+        return self
+    
+    def build(self) -> Dict:
+        return self.model
+
+class SnapshotModelParser(ConfigParser):
+    def __init__(self, snapshot: ModelSnapshot = None):
+        self.snapshot = snapshot or ModelSnapshot()
+    
+    def parse(self, file_path: str) -> Dict:
+        return self.parse_into(file_path, ModelDataBuilder()).build()
+    
+    def parse_into(self, file_path: str, builder: ModelBuilder) -> ModelBuilder:
+        with open_input(file_path) as f:
+            return self.snapshot.load(f, builder)
\ No newline at end of file
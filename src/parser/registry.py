@@ -0,0 +1,63 @@
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+from src.model.snapshot import ModelSnapshot
+from src.parser.compression import open_input, strip_compression_suffix
+from src.parser.parser import ConfigParser, JsonConfigParser, XmlConfigParser, SnapshotModelParser
+
+UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def leading_bytes(head: bytes) -> bytes:
+    if head.startswith(UTF8_BOM):
+        head = head[len(UTF8_BOM):]
+    return head.lstrip(b" \t\r\n")
+
+
+def sniff_snapshot(head: bytes) -> bool:
+    return head.startswith(ModelSnapshot.MAGIC)
+
+
+def sniff_xml(head: bytes) -> bool:
+    return leading_bytes(head).startswith(b"<")
+
+
+def sniff_json(head: bytes) -> bool:
+    return leading_bytes(head).startswith(b"{")
+
+
+class ParserRegistry:
+    def __init__(self, sample_size: int = 512):
+        self.sample_size = sample_size
+        self.entries: List[Tuple[ConfigParser, Optional[Callable[[bytes], bool]]]] = []
+        self.extensions: Dict[str, ConfigParser] = {}
+    
+    def register(self, parser: ConfigParser, extensions: Tuple[str, ...] = (),
+                 sniff: Optional[Callable[[bytes], bool]] = None) -> 'ParserRegistry':
+        self.entries.append((parser, sniff))
+        for extension in extensions:
+            self.extensions[extension.lower()] = parser
+        return self
+    
+    def for_extension(self, extension: str) -> Optional[ConfigParser]:
+        return self.extensions.get(extension.lower())
+    
+    def sniff(self, head: bytes) -> Optional[ConfigParser]:
+        for parser, sniff in self.entries:
+            if sniff is not None and sniff(head):
+                return parser
+        return None
+    
+    def detect(self, file_path: str) -> ConfigParser:
+        with open_input(file_path) as f:
+            head = f.read(self.sample_size)
+        parser = self.sniff(head) or self.for_extension(os.path.splitext(strip_compression_suffix(file_path))[1])
+        if parser is None:
+            raise ValueError(f"Unrecognized model format: {file_path}")
+        return parser
+
+
+def default_registry() -> ParserRegistry:
+    return (ParserRegistry()
+            .register(SnapshotModelParser(), (".mpsnap",), sniff_snapshot)
+            .register(XmlConfigParser(), (".xml", ".xmi"), sniff_xml)
+            .register(JsonConfigParser(), (".json",), sniff_json))
\ No newline at end of file
@@ -0,0 +1,92 @@
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+@dataclass
+class Stage:
+    name: str
+    func: Callable[..., Any]
+    args: Tuple = ()
+    depends_on: Tuple[str, ...] = ()
+    use_process: bool = False
+
+
+class StageError(Exception):
+    def __init__(self, errors: Dict[str, BaseException], results: Optional[Dict[str, Any]] = None):
+        self.errors = errors
+        self.results = results or {}
+        details = "; ".join(f"{name}: {type(error).__name__}: {error}" for name, error in errors.items())
+        super().__init__(f"{len(errors)} pipeline stage(s) failed: {details}")
+
+
+class SkippedStageError(Exception):
+    pass
+
+
+class StageScheduler:
+    def __init__(self, max_workers: Optional[int] = None, process_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self.process_workers = process_workers
+    
+    def run(self, stages: List[Stage]) -> Dict[str, Any]:
+        by_name = self._validate(stages)
+        results: Dict[str, Any] = {}
+        errors: Dict[str, BaseException] = {}
+        pending = dict(by_name)
+        running = {}
+        
+        process_pool = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as thread_pool:
+            try:
+                while pending or running:
+                    for name, stage in list(pending.items()):
+                        failed = [dep for dep in stage.depends_on if dep in errors]
+                        if failed:
+                            errors[name] = SkippedStageError(f"skipped because {', '.join(failed)} failed")
+                            del pending[name]
+                        elif all(dep in results for dep in stage.depends_on):
+                            if stage.use_process and process_pool is None:
+                                process_pool = ProcessPoolExecutor(max_workers=self.process_workers)
+                            executor: Executor = process_pool if stage.use_process else thread_pool
+                            dep_results = tuple(results[dep] for dep in stage.depends_on)
+                            running[executor.submit(stage.func, *stage.args, *dep_results)] = name
+                            del pending[name]
+                    if not running:
+                        continue
+                    
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        name = running.pop(future)
+                        try:
+                            results[name] = future.result()
+                        except Exception as e:
+                            errors[name] = e
+            finally:
+                if process_pool is not None:
+                    process_pool.shutdown()
+        
+        if errors:
+            raise StageError({name: errors[name] for name in by_name if name in errors}, results)
+        return results
+    
+    def _validate(self, stages: List[Stage]) -> Dict[str, Stage]:
+        by_name: Dict[str, Stage] = {}
+        for stage in stages:
+            if stage.name in by_name:
+                raise ValueError(f"Duplicate pipeline stage: {stage.name}")
+            by_name[stage.name] = stage
+        for stage in stages:
+            for dep in stage.depends_on:
+                if dep not in by_name:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dep}")
+        
+        resolved = set()
+        remaining = list(stages)
+        while remaining:
+            ready = [stage for stage in remaining if all(dep in resolved for dep in stage.depends_on)]
+            if not ready:
+                raise ValueError(f"Pipeline stages form a cycle: {', '.join(s.name for s in remaining)}")
+            resolved.update(stage.name for stage in ready)
+            remaining = [stage for stage in remaining if stage.name not in resolved]
+        return by_name
\ No newline at end of file
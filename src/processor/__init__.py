@@ -1,5 +1,17 @@
 from .model_processor import ModelProcessor
-from .comparator import ConfigComparator
-from .config_processor import ConfigProcessor, JsonConfigProcessor
+from .model_cache import ModelCache
+from .overlay import DeltaOverlay
+from .config_store import ConfigStore, diff_stores
+from .comparator import ConfigComparator, DeepConfigComparator
+from .streaming_comparator import StreamingConfigComparator
+from .sharded_comparator import ShardedConfigComparator
+from .config_processor import ConfigProcessor, JsonConfigProcessor, StreamingJsonConfigProcessor, ConfigStoreProcessor
+from .patch_chain import PatchChain, PatchChainConfigProcessor
 
-__all__ = ['ModelProcessor', 'ConfigComparator', 'ConfigProcessor', 'JsonConfigProcessor']
\ No newline at end of file
+__all__ = [
+    'ModelProcessor', 'ModelCache',
+    'DeltaOverlay', 'ConfigComparator', 'DeepConfigComparator', 'StreamingConfigComparator', 'ShardedConfigComparator',
+    'ConfigProcessor', 'JsonConfigProcessor', 'StreamingJsonConfigProcessor', 'ConfigStoreProcessor',
+    'ConfigStore', 'diff_stores',
+    'PatchChain', 'PatchChainConfigProcessor'
+]
\ No newline at end of file
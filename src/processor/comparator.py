@@ -1,7 +1,14 @@
-from typing import Dict
+import hashlib
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, List, Optional, Union
+from src.processor.config_store import ConfigStore, diff_stores
+from src.processor.overlay import DeltaOverlay
 
 
 class ConfigComparator:
+    flat_deltas = True
+    
     def compare_configs(self, original: Dict, patched: Dict) -> Dict:
         delta = {"additions": [], "deletions": [], "updates": []}
         
@@ -19,8 +26,8 @@ class ConfigComparator:
         
         return delta
     
-    def apply_delta(self, original: Dict, delta: Dict) -> Dict:
-        result = original.copy()
+    def apply_delta(self, original: Dict, delta: Dict, in_place: bool = False) -> Dict:
+        result = original if in_place else original.copy()
         
         for key in delta["deletions"]:
             result.pop(key, None)
@@ -31,4 +38,212 @@ class ConfigComparator:
         for addition in delta["additions"]:
             result[addition["key"]] = addition["value"]
         
-        return result
\ No newline at end of file
+        return result
+    
+    def overlay(self, original: Dict, delta: Dict) -> Mapping:
+        return DeltaOverlay(original, delta)
+    
+    def compare_stores(self, original: ConfigStore, patched: ConfigStore, start: Optional[str] = None,
+                       stop: Optional[str] = None, prefix: Optional[str] = None) -> Dict:
+        return diff_stores(original, patched, start, stop, prefix)
+    
+    def compose_deltas(self, deltas: List[Dict]) -> Dict:
+        states: Dict[Any, List] = {}
+        sequence = 0
+        
+        def assign(state: List, value: Any) -> None:
+            nonlocal sequence
+            if not state[1]:
+                state[3] = state[3] or state[0]
+                state[5] = sequence
+                sequence += 1
+            state[1] = True
+            state[2] = value
+        
+        for delta in deltas:
+            for key in delta["deletions"]:
+                state = states.get(key)
+                if state is None:
+                    states[key] = [True, False, None, False, None, None]
+                else:
+                    state[1] = False
+            for update in delta["updates"]:
+                state = states.get(update["key"])
+                if state is None:
+                    states[update["key"]] = [True, True, update["to"], False, update["from"], None]
+                else:
+                    assign(state, update["to"])
+            for addition in delta["additions"]:
+                state = states.get(addition["key"])
+                if state is None:
+                    states[addition["key"]] = [False, True, addition["value"], False, None, sequence]
+                    sequence += 1
+                else:
+                    assign(state, addition["value"])
+        
+        composed = {"additions": [], "deletions": [], "updates": []}
+        additions = []
+        for key, (in_base, present, value, moved, from_value, position) in states.items():
+            if in_base and (moved or not present):
+                composed["deletions"].append(key)
+            if present and (moved or not in_base):
+                additions.append((position, key, value))
+            elif present and from_value != value:
+                composed["updates"].append({"key": key, "from": from_value, "to": value})
+        
+        additions.sort(key=lambda addition: addition[0])
+        composed["additions"] = [{"key": key, "value": value} for _, key, value in additions]
+        return composed
+
+class DeepConfigComparator(ConfigComparator):
+    flat_deltas = False
+    
+    def __init__(self, json_patch: bool = False):
+        self.json_patch = json_patch
+    
+    def compare_configs(self, original: Any, patched: Any) -> Union[Dict, List[Dict]]:
+        delta = {"additions": [], "deletions": [], "updates": []}
+        self._diff(original, patched, "", delta, {})
+        if self.json_patch:
+            return self.to_json_patch(delta)
+        return delta
+    
+    def apply_delta(self, original: Any, delta: Union[Dict, List[Dict]], in_place: bool = False) -> Any:
+        if isinstance(delta, dict):
+            if self._is_key_delta(delta):
+                return super().apply_delta(original, delta, in_place)
+            delta = self.to_json_patch(delta)
+        
+        copied = None if in_place else set()
+        result = original if in_place else self._copy(original, copied)
+        for operation in delta:
+            result = self._apply_operation(result, operation, copied)
+        return result
+    
+    def compose_deltas(self, deltas: List[Dict]) -> Dict:
+        raise TypeError("compose_deltas combines flat key deltas only; DeepConfigComparator produces path deltas")
+    
+    def compare_stores(self, original: ConfigStore, patched: ConfigStore, start: Optional[str] = None,
+                       stop: Optional[str] = None, prefix: Optional[str] = None) -> Union[Dict, List[Dict]]:
+        if start is None and stop is None and prefix is None:
+            return self.compare_configs(original.materialize(), patched.materialize())
+        return self.compare_configs(dict(original.sorted_items(*original.bounds(start, stop, prefix))),
+                                    dict(patched.sorted_items(*patched.bounds(start, stop, prefix))))
+    
+    def overlay(self, original: Any, delta: Union[Dict, List[Dict]]) -> Any:
+        if isinstance(original, dict) and isinstance(delta, dict) and self._is_key_delta(delta):
+            return super().overlay(original, delta)
+        return self.apply_delta(original, delta)
+    
+    def to_json_patch(self, delta: Dict) -> List[Dict]:
+        operations = []
+        for deletion in delta["deletions"]:
+            operations.append({"op": "remove", "path": deletion["path"]})
+        for update in delta["updates"]:
+            operations.append({"op": "replace", "path": update["path"], "value": update["to"]})
+        for addition in delta["additions"]:
+            operations.append({"op": "add", "path": addition["path"], "value": addition["value"]})
+        return operations
+    
+    def _diff(self, original: Any, patched: Any, path: str, delta: Dict, digests: Dict[int, bytes]) -> None:
+        if isinstance(original, dict) and isinstance(patched, dict):
+            if self._digest(original, digests) == self._digest(patched, digests):
+                return
+            for key in patched:
+                if key not in original:
+                    delta["additions"].append({"path": self._child_path(path, key), "value": patched[key]})
+            for key in original:
+                if key not in patched:
+                    delta["deletions"].append({"path": self._child_path(path, key)})
+            for key in original:
+                if key in patched:
+                    self._diff(original[key], patched[key], self._child_path(path, key), delta, digests)
+        elif isinstance(original, list) and isinstance(patched, list):
+            if self._digest(original, digests) == self._digest(patched, digests):
+                return
+            common = min(len(original), len(patched))
+            for idx in range(common):
+                self._diff(original[idx], patched[idx], f"{path}/{idx}", delta, digests)
+            for idx in range(common, len(patched)):
+                delta["additions"].append({"path": f"{path}/{idx}", "value": patched[idx]})
+            for idx in reversed(range(common, len(original))):
+                delta["deletions"].append({"path": f"{path}/{idx}"})
+        elif original != patched:
+            delta["updates"].append({"path": path, "from": original, "to": patched})
+    
+    def _digest(self, value: Any, digests: Dict[int, bytes]) -> bytes:
+        if isinstance(value, dict):
+            cached = digests.get(id(value))
+            if cached is None:
+                h = hashlib.blake2b(b"{", digest_size=16)
+                for key in sorted(value):
+                    h.update(json.dumps(key).encode("utf-8"))
+                    h.update(self._digest(value[key], digests))
+                cached = digests[id(value)] = h.digest()
+            return cached
+        if isinstance(value, list):
+            cached = digests.get(id(value))
+            if cached is None:
+                h = hashlib.blake2b(b"[", digest_size=16)
+                for item in value:
+                    h.update(self._digest(item, digests))
+                cached = digests[id(value)] = h.digest()
+            return cached
+        return hashlib.blake2b(json.dumps(value).encode("utf-8"), digest_size=16).digest()
+    
+    def _apply_operation(self, result: Any, operation: Dict, copied: set) -> Any:
+        op = operation["op"]
+        tokens = self._parse_path(operation["path"])
+        if not tokens:
+            if op == "remove":
+                raise ValueError("Cannot remove the document root")
+            return operation["value"]
+        
+        parent = result
+        for token in tokens[:-1]:
+            key = self._container_key(parent, token)
+            child = parent[key]
+            if copied is not None and id(child) not in copied:
+                child = parent[key] = self._copy(child, copied)
+            parent = child
+        
+        key = tokens[-1]
+        if isinstance(parent, list):
+            if op == "add":
+                parent.insert(len(parent) if key == "-" else int(key), operation["value"])
+                return result
+            key = int(key)
+        if op == "remove":
+            del parent[key]
+        elif op in ("add", "replace"):
+            if op == "replace" and isinstance(parent, dict) and key not in parent:
+                raise KeyError(f"Path not found for replace: {operation['path']}")
+            parent[key] = operation["value"]
+        else:
+            raise ValueError(f"Unsupported JSON Patch operation: {op}")
+        return result
+    
+    def _copy(self, value: Any, copied: set) -> Any:
+        if isinstance(value, (dict, list)):
+            value = value.copy()
+            copied.add(id(value))
+        return value
+    
+    def _container_key(self, container: Any, token: str) -> Any:
+        return int(token) if isinstance(container, list) else token
+    
+    def _is_key_delta(self, delta: Dict) -> bool:
+        for section in ("additions", "deletions", "updates"):
+            for entry in delta.get(section, []):
+                return not isinstance(entry, dict) or "key" in entry
+        return False
+    
+    def _child_path(self, path: str, key: str) -> str:
+        return f"{path}/{str(key).replace('~', '~0').replace('/', '~1')}"
+    
+    def _parse_path(self, path: str) -> List[str]:
+        if path == "":
+            return []
+        if not path.startswith("/"):
+            raise ValueError(f"Invalid JSON Pointer: {path}")
+        return [token.replace("~1", "/").replace("~0", "~") for token in path[1:].split("/")]
\ No newline at end of file
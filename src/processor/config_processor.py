@@ -2,28 +2,104 @@ import json
 from abc import ABC, abstractmethod
 from src.config import AppConfiguration
 from src.processor.comparator import ConfigComparator
+from src.processor.config_store import ConfigStore
+from src.processor.streaming_comparator import StreamingConfigComparator
+from src.instrumentation import NULL_INSTRUMENTATION
+from src.serializer import JsonSerializer, PrettyJsonSerializer
 
 
 class ConfigProcessor(ABC):
+    instrumentation = NULL_INSTRUMENTATION
+    
     @abstractmethod
     def process(self, config: AppConfiguration, comparator: ConfigComparator) -> None:
         raise NotImplementedError
 
 class JsonConfigProcessor(ConfigProcessor):
+    def __init__(self, serializer: JsonSerializer = None):
+        self.serializer = serializer or PrettyJsonSerializer()
+    
     def process(self, config: AppConfiguration, comparator: ConfigComparator) -> None:
         try:
-            configs = []
-            for input_path in config.input_config_paths:
-                with open(input_path, "r") as f:
-                    configs.append(json.load(f))
+            with self.instrumentation.stage("configs.load") as stage:
+                configs = []
+                for input_path in config.input_config_paths:
+                    with open(input_path, "r") as f:
+                        configs.append(json.load(f))
+                stage.count("original_keys", len(configs[0]) if isinstance(configs[0], dict) else 0)
+                stage.count("patched_keys", len(configs[1]) if isinstance(configs[1], dict) else 0)
             
-            delta = comparator.compare_configs(configs[0], configs[1])
-            with open(config.output_config_paths[0], "w") as f:
-                json.dump(delta, f, indent=4)
+            with self.instrumentation.stage("configs.compare") as stage:
+                delta = comparator.compare_configs(configs[0], configs[1])
+                if isinstance(delta, dict):
+                    for section, changes in delta.items():
+                        stage.count(section, len(changes))
+            with self.instrumentation.stage("configs.dump_delta"):
+                with open(config.output_config_paths[0], "w", encoding="utf-8") as f:
+                    self.serializer.dump(delta, f)
             
-            res_patched_config = comparator.apply_delta(configs[0], delta)
-            with open(config.output_config_paths[1], "w") as f:
-                json.dump(res_patched_config, f, indent=4)
+            with self.instrumentation.stage("configs.apply"):
+                res_patched_config = comparator.overlay(configs[0], delta)
+            with self.instrumentation.stage("configs.dump_patched"):
+                with open(config.output_config_paths[1], "w", encoding="utf-8") as f:
+                    self.serializer.dump(res_patched_config, f)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {e}") from e
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {e}", e.doc, e.pos) from e
+        except IOError as e:
+            raise IOError(f"Failed to process configuration files: {e}") from e
+
+class StreamingJsonConfigProcessor(ConfigProcessor):
+    def process(self, config: AppConfiguration, comparator: ConfigComparator) -> None:
+        if type(comparator) is ConfigComparator:
+            comparator = StreamingConfigComparator()
+        elif not isinstance(comparator, StreamingConfigComparator):
+            raise TypeError(f"StreamingJsonConfigProcessor requires a StreamingConfigComparator, "
+                            f"got {type(comparator).__name__}")
+        try:
+            with self.instrumentation.stage("configs.stream_compare") as stage:
+                counts = comparator.compare_files(config.input_config_paths[0], config.input_config_paths[1],
+                                                  config.output_config_paths[0], config.output_config_paths[1])
+                for section, count in counts.items():
+                    stage.count(section, count)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {e}") from e
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {e}", e.doc, e.pos) from e
+        except IOError as e:
+            raise IOError(f"Failed to process configuration files: {e}") from e
+
+class ConfigStoreProcessor(ConfigProcessor):
+    def __init__(self, store_dir: str = ".config_store", serializer: JsonSerializer = None):
+        self.store_dir = store_dir
+        self.serializer = serializer or PrettyJsonSerializer()
+    
+    def process(self, config: AppConfiguration, comparator: ConfigComparator) -> None:
+        try:
+            with self.instrumentation.stage("configs.load") as stage:
+                original = ConfigStore.open_or_build(config.input_config_paths[0], self.store_dir)
+                patched = ConfigStore.open_or_build(config.input_config_paths[1], self.store_dir)
+                stage.count("original_keys", len(original))
+                stage.count("patched_keys", len(patched))
+            try:
+                with self.instrumentation.stage("configs.compare") as stage:
+                    delta = comparator.compare_stores(original, patched)
+                    if isinstance(delta, dict):
+                        for section, changes in delta.items():
+                            stage.count(section, len(changes))
+                with self.instrumentation.stage("configs.dump_delta"):
+                    with open(config.output_config_paths[0], "w", encoding="utf-8") as f:
+                        self.serializer.dump(delta, f)
+                
+                with self.instrumentation.stage("configs.apply"):
+                    res_patched_config = comparator.overlay(original, delta)
+                with self.instrumentation.stage("configs.dump_patched"):
+                    with open(config.output_config_paths[1], "w", encoding="utf-8") as f:
+                        self.serializer.dump(res_patched_config, f)
+            finally:
+                original.close()
+                patched.close()
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Configuration file not found: {e}") from e
         except json.JSONDecodeError as e:
@@ -0,0 +1,338 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from bisect import bisect_left
+from collections.abc import ItemsView, ValuesView
+from itertools import accumulate, islice
+from operator import itemgetter
+from typing import Any, BinaryIO, Dict, Iterable, Iterator, Optional, Tuple
+from src.parser import StreamingJsonConfigParser
+from src.serializer import ChunkedMapping, compact_encoder
+
+
+def encode_key(key: str) -> bytes:
+    return key.encode("utf-8", "surrogatepass")
+
+
+def decode_key(raw: bytes) -> str:
+    return raw.decode("utf-8", "surrogatepass")
+
+
+encode_value_text = compact_encoder()
+
+
+def encode_value(value: Any) -> bytes:
+    return encode_value_text(value).encode("ascii")
+
+
+def prefix_end(raw: bytes) -> Optional[bytes]:
+    raw = raw.rstrip(b"\xff")
+    return raw[:-1] + bytes((raw[-1] + 1,)) if raw else None
+
+
+class SortedKeys:
+    def __init__(self, store: 'ConfigStore'):
+        self.store = store
+    
+    def __len__(self) -> int:
+        return len(self.store)
+    
+    def __getitem__(self, idx: int) -> bytes:
+        return self.store.raw_key(idx)
+
+
+class ConfigStore(ChunkedMapping):
+    MAGIC = b"CFGSTORE"
+    VERSION = 1
+    HEADER = struct.Struct("<8sH6xQQQQQ")
+    SUFFIX = ".cstore"
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._open()
+    
+    def _open(self) -> None:
+        with open(self.path, "rb") as f:
+            header = f.read(self.HEADER.size)
+            if len(header) != self.HEADER.size:
+                raise ValueError("Truncated config store header")
+            magic, version, count, keys_size, values_size, source_size, source_mtime = self.HEADER.unpack(header)
+            if magic != self.MAGIC:
+                raise ValueError("Not a config store")
+            if version != self.VERSION:
+                raise ValueError(f"Unsupported config store version: {version}")
+            self.count = count
+            self.source = (source_size, source_mtime)
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        
+        sizes = (count + 1, count, count, count, count)
+        offset = self.HEADER.size
+        arrays = []
+        for size in sizes:
+            arrays.append(self._u64_array(offset, size))
+            offset += size * 8
+        self.key_offsets, self.value_offsets, self.value_lengths, self.positions, self.order = arrays
+        self.keys_start = offset
+        self.values_start = offset + keys_size
+        if len(self.mm) != self.values_start + values_size:
+            self.close()
+            raise ValueError("Truncated config store")
+        self.sorted_keys = SortedKeys(self)
+    
+    def _u64_array(self, offset: int, size: int) -> Any:
+        view = memoryview(self.mm)[offset:offset + size * 8]
+        if sys.byteorder == "little":
+            return view.cast("Q")
+        values = array("Q")
+        values.frombytes(view)
+        view.release()
+        values.byteswap()
+        return values
+    
+    def close(self) -> None:
+        for values in (getattr(self, name, None) for name in
+                       ("key_offsets", "value_offsets", "value_lengths", "positions", "order")):
+            if isinstance(values, memoryview):
+                values.release()
+        self.mm.close()
+    
+    def __enter__(self) -> 'ConfigStore':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+    
+    def __getstate__(self) -> Dict:
+        return {"path": self.path}
+    
+    def __setstate__(self, state: Dict) -> None:
+        self.path = state["path"]
+        self._open()
+    
+    @classmethod
+    def write(cls, items: Iterable[Tuple[str, Any]], path: str, source: Tuple[int, int] = (0, 0)) -> None:
+        directory = os.path.dirname(os.path.abspath(path))
+        entries: Dict[bytes, Tuple[int, int, int]] = {}
+        with tempfile.TemporaryFile(dir=directory) as values:
+            offset = 0
+            pending = []
+            for key, value in items:
+                data = encode_value(value)
+                pending.append(data)
+                raw = encode_key(key)
+                entry = entries.get(raw)
+                entries[raw] = (len(entries) if entry is None else entry[0], offset, len(data))
+                offset += len(data)
+                if len(pending) >= 4096:
+                    values.write(b"".join(pending))
+                    pending.clear()
+            values.write(b"".join(pending))
+            values_size = offset
+            
+            keys = sorted(entries)
+            records = [entries[key] for key in keys]
+            del entries
+            key_offsets = array("Q", accumulate(map(len, keys), initial=0))
+            positions = array("Q", map(itemgetter(0), records))
+            value_offsets = array("Q", map(itemgetter(1), records))
+            value_lengths = array("Q", map(itemgetter(2), records))
+            order = array("Q", sorted(range(len(keys)), key=positions.__getitem__))
+            total = key_offsets[-1]
+            del records
+            
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(cls.HEADER.pack(cls.MAGIC, cls.VERSION, len(keys), total, values_size, *source))
+                    for values_array in (key_offsets, value_offsets, value_lengths, positions, order):
+                        if sys.byteorder != "little":
+                            values_array.byteswap()
+                        f.write(values_array.tobytes())
+                    f.write(b"".join(keys))
+                    values.seek(0)
+                    cls._copy(values, f)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+    
+    @staticmethod
+    def _copy(source: BinaryIO, target: BinaryIO) -> None:
+        for chunk in iter(lambda: source.read(1024 * 1024), b""):
+            target.write(chunk)
+    
+    @classmethod
+    def build(cls, json_path: str, path: str, parser: Optional[StreamingJsonConfigParser] = None) -> 'ConfigStore':
+        parser = parser or StreamingJsonConfigParser()
+        cls.write(parser.iter_items(json_path), path, cls.source_state(json_path))
+        return cls(path)
+    
+    @classmethod
+    def open_or_build(cls, json_path: str, store_dir: str,
+                      parser: Optional[StreamingJsonConfigParser] = None) -> 'ConfigStore':
+        os.makedirs(store_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(json_path))[0]
+        digest = hashlib.sha1(os.path.abspath(json_path).encode("utf-8")).hexdigest()[:12]
+        path = os.path.join(store_dir, f"{stem}-{digest}{cls.SUFFIX}")
+        try:
+            store = cls(path)
+        except (FileNotFoundError, ValueError):
+            return cls.build(json_path, path, parser)
+        if store.source != cls.source_state(json_path):
+            store.close()
+            return cls.build(json_path, path, parser)
+        return store
+    
+    @staticmethod
+    def source_state(json_path: str) -> Tuple[int, int]:
+        stat = os.stat(json_path)
+        return stat.st_size, stat.st_mtime_ns
+    
+    def raw_key(self, idx: int) -> bytes:
+        return self.mm[self.keys_start + self.key_offsets[idx]:self.keys_start + self.key_offsets[idx + 1]]
+    
+    def raw_value(self, idx: int) -> bytes:
+        start = self.values_start + self.value_offsets[idx]
+        return self.mm[start:start + self.value_lengths[idx]]
+    
+    def key(self, idx: int) -> str:
+        return decode_key(self.raw_key(idx))
+    
+    def value(self, idx: int) -> Any:
+        return json.loads(self.raw_value(idx))
+    
+    def find(self, key: str) -> int:
+        if not isinstance(key, str):
+            return -1
+        raw = encode_key(key)
+        idx = bisect_left(self.sorted_keys, raw)
+        if idx < self.count and self.raw_key(idx) == raw:
+            return idx
+        return -1
+    
+    def bounds(self, start: Optional[str] = None, stop: Optional[str] = None,
+               prefix: Optional[str] = None) -> Tuple[int, int]:
+        low, high = 0, self.count
+        if prefix is not None:
+            raw = encode_key(prefix)
+            low = bisect_left(self.sorted_keys, raw)
+            end = prefix_end(raw)
+            if end is not None:
+                high = bisect_left(self.sorted_keys, end)
+        if start is not None:
+            low = max(low, bisect_left(self.sorted_keys, encode_key(start)))
+        if stop is not None:
+            high = min(high, bisect_left(self.sorted_keys, encode_key(stop)))
+        return low, max(low, high)
+    
+    def prefix(self, prefix: str) -> Iterator[Tuple[str, Any]]:
+        return self.sorted_items(*self.bounds(prefix=prefix))
+    
+    def range(self, start: Optional[str] = None, stop: Optional[str] = None) -> Iterator[Tuple[str, Any]]:
+        return self.sorted_items(*self.bounds(start, stop))
+    
+    def sorted_items(self, low: int = 0, high: Optional[int] = None) -> Iterator[Tuple[str, Any]]:
+        for idx in range(low, self.count if high is None else high):
+            yield self.key(idx), self.value(idx)
+    
+    def __getitem__(self, key: str) -> Any:
+        idx = self.find(key)
+        if idx < 0:
+            raise KeyError(key)
+        return self.value(idx)
+    
+    def __contains__(self, key: Any) -> bool:
+        return self.find(key) >= 0
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def __iter__(self) -> Iterator[str]:
+        key = self.key
+        for idx in self.order:
+            yield key(idx)
+    
+    def items(self) -> 'ConfigStoreItems':
+        return ConfigStoreItems(self)
+    
+    def values(self) -> 'ConfigStoreValues':
+        return ConfigStoreValues(self)
+    
+    def iter_items(self) -> Iterator[Tuple[str, Any]]:
+        key = self.key
+        value = self.value
+        for idx in self.order:
+            yield key(idx), value(idx)
+    
+    def batches(self, size: int) -> Iterator[Dict]:
+        items = self.iter_items()
+        while True:
+            batch = dict(islice(items, size))
+            if not batch:
+                return
+            yield batch
+
+
+class ConfigStoreItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        return self._mapping.iter_items()
+
+
+class ConfigStoreValues(ValuesView):
+    def __iter__(self) -> Iterator:
+        for _, value in self._mapping.iter_items():
+            yield value
+
+
+def iter_entries(store: ConfigStore, low: int, high: int) -> Iterator[Tuple[bytes, int, int, int]]:
+    mm = store.mm
+    keys_start = store.keys_start
+    values_start = store.values_start
+    key_offsets = store.key_offsets
+    for key_start, key_end, value_offset, value_length, position in zip(
+            key_offsets[low:high], key_offsets[low + 1:high + 1], store.value_offsets[low:high],
+            store.value_lengths[low:high], store.positions[low:high]):
+        value_start = values_start + value_offset
+        yield mm[keys_start + key_start:keys_start + key_end], value_start, value_start + value_length, position
+
+
+def diff_stores(original: ConfigStore, patched: ConfigStore, start: Optional[str] = None,
+                stop: Optional[str] = None, prefix: Optional[str] = None) -> Dict:
+    o_mm = original.mm
+    p_mm = patched.mm
+    o_entries = iter_entries(original, *original.bounds(start, stop, prefix))
+    p_entries = iter_entries(patched, *patched.bounds(start, stop, prefix))
+    additions, deletions, updates = [], [], []
+    sentinel = (None, 0, 0, 0)
+    o_key, o_start, o_end, o_position = next(o_entries, sentinel)
+    p_key, p_start, p_end, p_position = next(p_entries, sentinel)
+    while o_key is not None or p_key is not None:
+        if p_key is None or (o_key is not None and o_key < p_key):
+            deletions.append((o_position, decode_key(o_key)))
+            o_key, o_start, o_end, o_position = next(o_entries, sentinel)
+            continue
+        if o_key is None or p_key < o_key:
+            additions.append((p_position, {"key": decode_key(p_key), "value": json.loads(p_mm[p_start:p_end])}))
+        else:
+            o_raw = o_mm[o_start:o_end]
+            p_raw = p_mm[p_start:p_end]
+            if o_raw != p_raw or b"NaN" in o_raw:
+                o_value = json.loads(o_raw)
+                p_value = json.loads(p_raw)
+                if o_value != p_value:
+                    updates.append((o_position, {"key": decode_key(p_key), "from": o_value, "to": p_value}))
+            o_key, o_start, o_end, o_position = next(o_entries, sentinel)
+        p_key, p_start, p_end, p_position = next(p_entries, sentinel)
+    
+    by_position = itemgetter(0)
+    return {
+        "additions": [entry for _, entry in sorted(additions, key=by_position)],
+        "deletions": [key for _, key in sorted(deletions, key=by_position)],
+        "updates": [entry for _, entry in sorted(updates, key=by_position)]
+    }
\ No newline at end of file
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import tempfile
+from typing import Dict, Optional
+from src.model import ModelBuilder, ModelSnapshot
+from src.parser import PARSER_VERSION
+
+
+class ModelCache:
+    SUFFIX = ".mpsnap"
+
+    def __init__(self, cache_dir: str = ".model_cache", max_bytes: int = 256 * 1024 * 1024):
+        if max_bytes <= 0:
+            raise ValueError(f"max_bytes must be positive, got {max_bytes}")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.snapshot = ModelSnapshot()
+        os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def key(self, input_file: str) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{PARSER_VERSION}:{ModelSnapshot.VERSION}:".encode("utf-8"))
+        with open(input_file, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + self.SUFFIX)
+    
+    def load(self, key: str, builder: ModelBuilder) -> Optional[ModelBuilder]:
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                self.snapshot.load(f, builder)
+        except FileNotFoundError:
+            return None
+        except (ValueError, UnicodeDecodeError, IndexError):
+            self._remove(path)
+            return None
+        os.utime(path)
+        return builder
+    
+    def store(self, key: str, model: Dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                self.snapshot.dump(model, f)
+            os.replace(tmp_path, self.path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self.evict()
+    
+    def evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(self.SUFFIX):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+    
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
\ No newline at end of file
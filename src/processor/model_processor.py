@@ -1,17 +1,57 @@
-import os
-from typing import Dict
-from src.parser import ConfigParserFactory
+from typing import Dict, Optional
+from src.parser import ConfigParserFactory, XmlConfigParser, StreamingXmlConfigParser, SnapshotModelParser
 from src.model import Builder, ModelDirector
+from src.processor.model_cache import ModelCache
+from src.instrumentation import NULL_INSTRUMENTATION, StageMetrics
 
 class ModelProcessor:
-    def __init__(self):
+    instrumentation = NULL_INSTRUMENTATION
+    
+    def __init__(self, streaming: bool = False, cache: Optional[ModelCache] = None):
         self.parser_factory = ConfigParserFactory()
-        self.model_builder = Builder()
+        self.builder_factory = Builder
+        self.streaming = streaming
+        self.cache = cache
     
     def process_model(self, input_file: str) -> Dict:
-        extension = os.path.splitext(input_file)[1]
-        parser = self.parser_factory.create_parser(extension)
-        model_data = parser.parse(input_file)
-        director = ModelDirector(self.model_builder)
-        director.construct(model_data)
-        return self.model_builder.build()
\ No newline at end of file
+        model_builder = self.builder_factory()
+        cache_key = None
+        if self.cache:
+            with self.instrumentation.stage("model.cache_load") as stage:
+                cache_key = self.cache.key(input_file)
+                hit = self.cache.load(cache_key, model_builder) is not None
+                stage.count("hit", int(hit))
+            if hit:
+                with self.instrumentation.stage("model.build") as stage:
+                    return self._build(model_builder, stage)
+            model_builder = self.builder_factory()
+        
+        model = self._parse_model(input_file, model_builder)
+        if cache_key:
+            with self.instrumentation.stage("model.cache_store"):
+                self.cache.store(cache_key, model)
+        return model
+    
+    def _parse_model(self, input_file: str, model_builder: Builder) -> Dict:
+        parser = self.parser_factory.detect(input_file)
+        if self.streaming and isinstance(parser, XmlConfigParser):
+            parser = StreamingXmlConfigParser()
+        if isinstance(parser, (StreamingXmlConfigParser, SnapshotModelParser)):
+            with self.instrumentation.stage("model.parse"):
+                parser.parse_into(input_file, model_builder)
+            with self.instrumentation.stage("model.build") as stage:
+                return self._build(model_builder, stage)
+        with self.instrumentation.stage("model.parse"):
+            model_data = parser.parse(input_file)
+        with self.instrumentation.stage("model.build") as stage:
+            director = ModelDirector(model_builder)
+            director.construct(model_data)
+            return self._build(model_builder, stage)
+    
+    def _build(self, model_builder: Builder, stage: StageMetrics) -> Dict:
+        model = model_builder.build()
+        if self.instrumentation.enabled:
+            stage.count("classes", len(model["classes"]))
+            stage.count("attributes", sum(len(class_info.attributes) for class_info in model["classes"].values()))
+            stage.count("relations", len(model["relations"]))
+        return model
\ No newline at end of file
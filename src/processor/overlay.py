@@ -0,0 +1,88 @@
+from collections.abc import ItemsView, ValuesView
+from itertools import islice
+from typing import Any, Dict, Iterator, Tuple
+from src.serializer import ChunkedMapping
+
+
+class DeltaOverlay(ChunkedMapping):
+    def __init__(self, base: Dict, delta: Dict):
+        self.base = base
+        self.deleted = set(delta["deletions"])
+        self.changes = {}
+        for update in delta["updates"]:
+            self.changes[update["key"]] = update["to"]
+        for addition in delta["additions"]:
+            self.changes[addition["key"]] = addition["value"]
+        self.appended = [key for key in self.changes if key in self.deleted or key not in base]
+        self.touched = self.deleted | self.changes.keys()
+        self.size = len(base) - sum(1 for key in self.deleted if key in base) + len(self.appended)
+    
+    def __getitem__(self, key: Any) -> Any:
+        if key in self.changes:
+            return self.changes[key]
+        if key in self.deleted:
+            raise KeyError(key)
+        return self.base[key]
+    
+    def __contains__(self, key: Any) -> bool:
+        if key in self.changes:
+            return True
+        return key not in self.deleted and key in self.base
+    
+    def __len__(self) -> int:
+        return self.size
+    
+    def __iter__(self) -> Iterator:
+        for key, _ in self.iter_items():
+            yield key
+    
+    def items(self) -> 'DeltaOverlayItems':
+        return DeltaOverlayItems(self)
+    
+    def values(self) -> 'DeltaOverlayValues':
+        return DeltaOverlayValues(self)
+    
+    def iter_items(self) -> Iterator[Tuple[Any, Any]]:
+        if not self.touched:
+            yield from self.base.items()
+            return
+        touched = self.touched
+        deleted = self.deleted
+        changes = self.changes
+        for key, value in self.base.items():
+            if key in touched:
+                if key in deleted:
+                    continue
+                value = changes[key]
+            yield key, value
+        for key in self.appended:
+            yield key, changes[key]
+    
+    def batches(self, size: int) -> Iterator[Dict]:
+        items = iter(self.base.items())
+        touched = self.touched
+        while True:
+            batch = dict(islice(items, size))
+            if not batch:
+                break
+            if touched:
+                for key in touched.intersection(batch):
+                    if key in self.deleted:
+                        del batch[key]
+                    else:
+                        batch[key] = self.changes[key]
+            if batch:
+                yield batch
+        for start in range(0, len(self.appended), size):
+            yield {key: self.changes[key] for key in self.appended[start:start + size]}
+
+
+class DeltaOverlayItems(ItemsView):
+    def __iter__(self) -> Iterator[Tuple[Any, Any]]:
+        return self._mapping.iter_items()
+
+
+class DeltaOverlayValues(ValuesView):
+    def __iter__(self) -> Iterator:
+        for _, value in self._mapping.iter_items():
+            yield value
\ No newline at end of file
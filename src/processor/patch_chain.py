@@ -0,0 +1,113 @@
+import json
+from typing import Dict, List, Optional, Tuple
+from src.config import AppConfiguration
+from src.processor.comparator import ConfigComparator
+from src.processor.config_processor import ConfigProcessor
+from src.serializer import JsonSerializer, PrettyJsonSerializer
+
+DELTA_SECTIONS = ("additions", "deletions", "updates")
+
+
+def is_delta(document: Dict) -> bool:
+    return (isinstance(document, dict) and set(document) == set(DELTA_SECTIONS)
+            and all(isinstance(document[section], list) for section in DELTA_SECTIONS))
+
+
+class PatchChain:
+    def __init__(self, base: Dict, comparator: Optional[ConfigComparator] = None, snapshot_interval: int = 16):
+        if snapshot_interval <= 0:
+            raise ValueError(f"snapshot_interval must be positive, got {snapshot_interval}")
+        self.comparator = comparator or ConfigComparator()
+        if not self.comparator.flat_deltas:
+            raise TypeError(f"PatchChain requires a comparator with flat key deltas, "
+                            f"got {type(self.comparator).__name__}")
+        self.snapshot_interval = snapshot_interval
+        self.deltas: List[Dict] = []
+        self.snapshots: Dict[int, Dict] = {0: base}
+        self.head: Tuple[int, Dict] = (0, base)
+    
+    @property
+    def version(self) -> int:
+        return len(self.deltas)
+    
+    def append_delta(self, delta: Dict) -> int:
+        self.deltas.append(delta)
+        return self.version
+    
+    def append_config(self, config: Dict) -> int:
+        return self.append_delta(self.comparator.compare_configs(self._materialize(self.version), config))
+    
+    def delta(self, start: int = 0, end: Optional[int] = None) -> Dict:
+        end = self.version if end is None else end
+        self._check_version(start)
+        self._check_version(end)
+        if start > end:
+            raise ValueError(f"Cannot compose deltas backwards from version {start} to {end}")
+        return self.comparator.compose_deltas(self.deltas[start:end])
+    
+    def checkout(self, version: Optional[int] = None) -> Dict:
+        version = self.version if version is None else version
+        return self._materialize(version).copy()
+    
+    def _materialize(self, version: int) -> Dict:
+        self._check_version(version)
+        if self.head[0] == version:
+            return self.head[1]
+        start = version - version % self.snapshot_interval
+        while start not in self.snapshots:
+            start -= self.snapshot_interval
+        config = self.snapshots[start]
+        if self.head[0] > start and self.head[0] < version:
+            start, config = self.head
+        
+        owned = start not in self.snapshots
+        while start < version:
+            end = min(version, (start // self.snapshot_interval + 1) * self.snapshot_interval)
+            config = self.comparator.apply_delta(config, self.delta(start, end), in_place=owned)
+            owned = True
+            if end % self.snapshot_interval == 0:
+                self.snapshots[end] = config
+                owned = False
+            start = end
+        self.head = (version, config)
+        return config
+    
+    def _check_version(self, version: int) -> None:
+        if not 0 <= version <= self.version:
+            raise ValueError(f"Version {version} is out of range 0..{self.version}")
+
+
+class PatchChainConfigProcessor(ConfigProcessor):
+    def __init__(self, version: Optional[int] = None, snapshot_interval: int = 16,
+                 serializer: Optional[JsonSerializer] = None):
+        self.version = version
+        self.snapshot_interval = snapshot_interval
+        self.serializer = serializer or PrettyJsonSerializer()
+    
+    def process(self, config: AppConfiguration, comparator: ConfigComparator) -> None:
+        try:
+            with self.instrumentation.stage("configs.load") as stage:
+                with open(config.input_config_paths[0], "r") as f:
+                    chain = PatchChain(json.load(f), comparator, self.snapshot_interval)
+                for input_path in config.input_config_paths[1:]:
+                    with open(input_path, "r") as f:
+                        document = json.load(f)
+                    if is_delta(document):
+                        chain.append_delta(document)
+                    else:
+                        chain.append_config(document)
+                stage.count("versions", chain.version)
+            
+            version = chain.version if self.version is None else self.version
+            with self.instrumentation.stage("configs.dump_delta"):
+                with open(config.output_config_paths[0], "w", encoding="utf-8") as f:
+                    self.serializer.dump(chain.delta(0, version), f)
+            with self.instrumentation.stage("configs.dump_patched"):
+                with open(config.output_config_paths[1], "w", encoding="utf-8") as f:
+                    self.serializer.dump(chain.checkout(version), f)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Configuration file not found: {e}") from e
+        except json.JSONDecodeError as e:
+            raise json.JSONDecodeError(f"Invalid JSON in configuration file: {e}", e.doc, e.pos) from e
+        except IOError as e:
+            raise IOError(f"Failed to process configuration files: {e}") from e
\ No newline at end of file
@@ -0,0 +1,95 @@
+import gc
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from src.processor.comparator import ConfigComparator
+
+_worker_inputs: Optional[Tuple[Dict, Dict, List, List]] = None
+
+
+def init_worker(inputs: Tuple[Dict, Dict, List, List]) -> None:
+    global _worker_inputs
+    _worker_inputs = inputs
+
+
+def split_ranges(size: int, shards: int) -> List[Tuple[int, int]]:
+    shards = max(1, min(shards, size))
+    step, extra = divmod(size, shards)
+    ranges = []
+    start = 0
+    for idx in range(shards):
+        stop = start + step + (idx < extra)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def compare_original_range(start: int, stop: int) -> Tuple[List, List]:
+    original, patched, original_keys, _ = _worker_inputs
+    deletions = []
+    updates = []
+    for key in original_keys[start:stop]:
+        if key in patched:
+            value = original[key]
+            patched_value = patched[key]
+            if value != patched_value:
+                updates.append({"key": key, "from": value, "to": patched_value})
+        else:
+            deletions.append(key)
+    return deletions, updates
+
+
+def compare_patched_range(start: int, stop: int) -> List:
+    original, patched, _, patched_keys = _worker_inputs
+    return [{"key": key, "value": patched[key]} for key in patched_keys[start:stop] if key not in original]
+
+
+def run_shard(task: Tuple[str, int, int]) -> Tuple:
+    kind, start, stop = task
+    if kind == "original":
+        return compare_original_range(start, stop)
+    return compare_patched_range(start, stop)
+
+
+def fork_available() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+class ShardedConfigComparator(ConfigComparator):
+    def __init__(self, workers: Optional[int] = None, shards_per_worker: int = 1, min_keys: int = 100000):
+        if workers is not None and workers <= 0:
+            raise ValueError(f"workers must be positive, got {workers}")
+        if shards_per_worker <= 0:
+            raise ValueError(f"shards_per_worker must be positive, got {shards_per_worker}")
+        self.workers = workers or os.cpu_count() or 1
+        self.shards_per_worker = shards_per_worker
+        self.min_keys = min_keys
+    
+    def compare_configs(self, original: Dict, patched: Dict) -> Dict:
+        if (self.workers == 1 or len(original) + len(patched) < self.min_keys or not fork_available()
+                or threading.active_count() > 1 or not isinstance(original, dict) or not isinstance(patched, dict)):
+            return super().compare_configs(original, patched)
+        
+        shards = self.workers * self.shards_per_worker
+        tasks = ([("original", start, stop) for start, stop in split_ranges(len(original), shards)] +
+                 [("patched", start, stop) for start, stop in split_ranges(len(patched), shards)])
+        inputs = (original, patched, list(original), list(patched))
+        with ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("fork"),
+                                 initializer=init_worker, initargs=(inputs,)) as executor:
+            gc.freeze()
+            try:
+                futures = [executor.submit(run_shard, task) for task in tasks]
+            finally:
+                gc.unfreeze()
+            results = [future.result() for future in futures]
+        
+        delta = {"additions": [], "deletions": [], "updates": []}
+        for (kind, _, _), result in zip(tasks, results):
+            if kind == "original":
+                delta["deletions"].extend(result[0])
+                delta["updates"].extend(result[1])
+            else:
+                delta["additions"].extend(result)
+        return delta
\ No newline at end of file
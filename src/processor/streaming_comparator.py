@@ -0,0 +1,149 @@
+import heapq
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from src.parser import StreamingJsonConfigParser
+from src.processor.comparator import ConfigComparator
+
+
+def format_json_value(value: Any, level: int) -> str:
+    if isinstance(value, (dict, list)) and value:
+        return json.dumps(value, indent=4).replace("\n", "\n" + "    " * level)
+    return json.dumps(value)
+
+
+class StreamingConfigComparator(ConfigComparator):
+    SECTIONS = ("additions", "deletions", "updates")
+    RUN_BATCH = 10000
+
+    def __init__(self, run_size: int = 500000, tmp_dir: Optional[str] = None, chunk_size: int = 1024 * 1024):
+        if run_size <= 0:
+            raise ValueError(f"run_size must be positive, got {run_size}")
+        self.run_size = run_size
+        self.tmp_dir = tmp_dir
+        self.parser = StreamingJsonConfigParser(chunk_size=chunk_size)
+    
+    def compare_files(self, original_path: str, patched_path: str, delta_path: str,
+                      result_path: Optional[str] = None) -> Dict[str, int]:
+        counts = dict.fromkeys(self.SECTIONS, 0)
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as work_dir:
+            original = self.sorted_items(self.parser.iter_items(original_path), work_dir)
+            patched = self.sorted_items(self.parser.iter_items(patched_path), work_dir)
+            
+            spools = {section: open(os.path.join(work_dir, section + ".part"), "w", encoding="utf-8")
+                      for section in self.SECTIONS}
+            result = _JsonObjectWriter(open(result_path, "w", encoding="utf-8")) if result_path else None
+            try:
+                for section, entry in self._merge_walk(original, patched, result):
+                    spool = spools[section]
+                    if counts[section]:
+                        spool.write(",\n")
+                    spool.write(entry)
+                    counts[section] += 1
+            finally:
+                for spool in spools.values():
+                    spool.close()
+                if result:
+                    result.close()
+            
+            with open(delta_path, "w", encoding="utf-8") as out:
+                out.write("{")
+                for idx, section in enumerate(self.SECTIONS):
+                    out.write(f'{"," if idx else ""}\n    "{section}": ')
+                    if not counts[section]:
+                        out.write("[]")
+                        continue
+                    out.write("[\n")
+                    with open(spools[section].name, "r", encoding="utf-8") as part:
+                        shutil.copyfileobj(part, out)
+                    out.write("\n    ]")
+                out.write("\n}")
+        return counts
+    
+    def sorted_items(self, items: Iterator[Tuple[str, Any]], work_dir: str) -> Iterator[Tuple[str, Any]]:
+        runs: List[str] = []
+        run: List[Tuple[str, Any]] = []
+        for item in items:
+            run.append(item)
+            if len(run) >= self.run_size:
+                runs.append(self._write_run(run, work_dir))
+                run = []
+        if runs:
+            if run:
+                runs.append(self._write_run(run, work_dir))
+            merged = heapq.merge(*(self._read_run(path) for path in runs), key=itemgetter(0))
+        else:
+            merged = iter(sorted(run, key=itemgetter(0)))
+        return self._last_per_key(merged)
+    
+    def _merge_walk(self, original: Iterator, patched: Iterator,
+                    result: Optional['_JsonObjectWriter']) -> Iterator[Tuple[str, str]]:
+        sentinel = (None, None)
+        o_key, o_value = next(original, sentinel)
+        p_key, p_value = next(patched, sentinel)
+        while o_key is not None or p_key is not None:
+            if p_key is None or (o_key is not None and o_key < p_key):
+                yield "deletions", "        " + json.dumps(o_key)
+                o_key, o_value = next(original, sentinel)
+                continue
+            if o_key is None or p_key < o_key:
+                yield "additions", self._entry({"key": p_key, "value": p_value})
+            elif o_value != p_value:
+                yield "updates", self._entry({"key": p_key, "from": o_value, "to": p_value})
+            if result:
+                result.write_item(p_key, p_value)
+            if o_key == p_key:
+                o_key, o_value = next(original, sentinel)
+            p_key, p_value = next(patched, sentinel)
+    
+    def _entry(self, entry: Dict) -> str:
+        fields = ",\n".join(f"            {json.dumps(name)}: {format_json_value(value, 3)}"
+                             for name, value in entry.items())
+        return f"        {{\n{fields}\n        }}"
+    
+    def _write_run(self, run: List[Tuple[str, Any]], work_dir: str) -> str:
+        run.sort(key=itemgetter(0))
+        fd, path = tempfile.mkstemp(dir=work_dir, suffix=".run")
+        with os.fdopen(fd, "wb") as f:
+            for start in range(0, len(run), self.RUN_BATCH):
+                pickle.dump(run[start:start + self.RUN_BATCH], f, protocol=pickle.HIGHEST_PROTOCOL)
+        return path
+    
+    def _read_run(self, path: str) -> Iterator[Tuple[str, Any]]:
+        with open(path, "rb") as f:
+            while True:
+                try:
+                    batch = pickle.load(f)
+                except EOFError:
+                    return
+                yield from batch
+    
+    def _last_per_key(self, items: Iterator[Tuple[str, Any]]) -> Iterator[Tuple[str, Any]]:
+        previous = None
+        for item in items:
+            if previous is not None and previous[0] != item[0]:
+                yield previous
+            previous = item
+        if previous is not None:
+            yield previous
+
+
+class _JsonObjectWriter:
+    def __init__(self, f: TextIO):
+        self.f = f
+        self.count = 0
+    
+    def write_item(self, key: str, value: Any) -> None:
+        self.f.write(",\n    " if self.count else "{\n    ")
+        self.f.write(json.dumps(key))
+        self.f.write(": ")
+        self.f.write(format_json_value(value, 1))
+        self.count += 1
+    
+    def close(self) -> None:
+        self.f.write("\n}" if self.count else "{}")
+        self.f.close()
\ No newline at end of file
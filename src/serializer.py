@@ -0,0 +1,283 @@
+import json
+import math
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from json.encoder import c_make_encoder, encode_basestring_ascii
+from itertools import islice
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def float_repr(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value == float("inf"):
+        return "Infinity"
+    if value == -float("inf"):
+        return "-Infinity"
+    return float.__repr__(value)
+
+
+def key_repr(key: Any) -> str:
+    if isinstance(key, str):
+        return key
+    if key is True:
+        return "true"
+    if key is False:
+        return "false"
+    if key is None:
+        return "null"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return float_repr(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+
+class ChunkedMapping(Mapping):
+    @abstractmethod
+    def batches(self, size: int) -> Iterator[Dict]:
+        raise NotImplementedError
+    
+    def materialize(self) -> Dict:
+        result = {}
+        for batch in self.batches(65536):
+            result.update(batch)
+        return result
+
+
+def mapping_default(value: Any) -> Any:
+    if isinstance(value, ChunkedMapping):
+        return value.materialize()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+
+def scalar_repr(value: Any) -> Optional[str]:
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        return float_repr(value)
+    return None
+
+
+def compact_encoder() -> Callable[[Any], str]:
+    if c_make_encoder is None:
+        return lambda value: json.dumps(value, separators=(",", ":"), default=mapping_default)
+    encoder = c_make_encoder(None, mapping_default, encode_basestring_ascii, None, ":", ",", False, False, True)
+    return lambda value: "".join(encoder(value, 0))
+
+
+SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+SCALAR_ENCODERS = {
+    str: encode_basestring_ascii,
+    int: int.__repr__,
+    float: float_repr,
+    bool: lambda value: "true" if value else "false",
+    type(None): lambda value: "null"
+}
+
+
+def has_non_finite(value: Any) -> bool:
+    stack = [value]
+    seen = set()
+    while stack:
+        o = stack.pop()
+        if isinstance(o, float):
+            if not math.isfinite(o):
+                return True
+            continue
+        if id(o) in seen:
+            continue
+        seen.add(id(o))
+        if isinstance(o, Mapping):
+            items = o.values()
+        elif isinstance(o, (list, tuple)):
+            items = o
+        else:
+            continue
+        types = set(map(type, items))
+        if float in types and not all(math.isfinite(item) for item in items if type(item) is float):
+            return True
+        if not SCALAR_TYPES.issuperset(types):
+            stack.extend(item for item in items if type(item) not in SCALAR_TYPES)
+    return False
+
+
+class JsonSerializer(ABC):
+    @abstractmethod
+    def dump(self, value: Any, f: TextIO) -> None:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def dumps(self, value: Any) -> str:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def dumps_item(self, value: Any) -> str:
+        raise NotImplementedError
+    
+    @abstractmethod
+    def join_items(self, items: List[str]) -> str:
+        raise NotImplementedError
+
+
+class PrettyJsonSerializer(JsonSerializer):
+    def __init__(self, indent: int = 4, chunk_size: int = 1024):
+        self.indent = " " * indent
+        self.chunk_size = chunk_size
+    
+    def dump(self, value: Any, f: TextIO) -> None:
+        self._encode(value, f.write)
+    
+    def dumps(self, value: Any) -> str:
+        chunks = []
+        self._encode(value, chunks.append)
+        return "".join(chunks)
+    
+    def dumps_item(self, value: Any) -> str:
+        return self.indent + self.dumps(value).replace("\n", "\n" + self.indent)
+    
+    def join_items(self, items: List[str]) -> str:
+        return "[\n" + ",\n".join(items) + "\n]" if items else "[]"
+    
+    def _encode(self, value: Any, write: Callable[[str], Any]) -> None:
+        parts = []
+        append = parts.append
+        chunk_size = self.chunk_size
+        indent = self.indent
+        indents = ["\n"]
+        leaf_encoders = {}
+        markers = set()
+        encoders = SCALAR_ENCODERS
+        leaf_types = SCALAR_TYPES
+        encode_str = encode_basestring_ascii
+        
+        def newline(level: int) -> str:
+            while len(indents) <= level:
+                indents.append(indents[-1] + indent)
+            return indents[level]
+        
+        def leaf_encoder(level: int) -> Callable:
+            encoder = leaf_encoders.get(level)
+            if encoder is None:
+                encoder = leaf_encoders[level] = c_make_encoder(
+                    None, None, encode_basestring_ascii, None, ": ", "," + newline(level + 1), False, False, True)
+            return encoder
+        
+        def encode_items(items: Any, level: int, is_mapping: bool, pending: str) -> str:
+            separator = "," + newline(level + 1)
+            for item in items:
+                if is_mapping:
+                    key, item = item
+                    pending += encode_str(key if isinstance(key, str) else key_repr(key)) + ": "
+                encoder = encoders.get(type(item))
+                if encoder is not None:
+                    append(pending + encoder(item))
+                else:
+                    append(pending)
+                    encode(item, level + 1)
+                pending = separator
+                if len(parts) >= chunk_size:
+                    write("".join(parts))
+                    parts.clear()
+            return pending
+        
+        def iter_batches(o: Any, is_mapping: bool) -> Iterator:
+            if isinstance(o, ChunkedMapping):
+                yield from o.batches(chunk_size)
+                return
+            items = iter(o.items() if is_mapping else o)
+            while True:
+                batch = dict(islice(items, chunk_size)) if is_mapping else list(islice(items, chunk_size))
+                if not batch:
+                    return
+                yield batch
+        
+        def encode_batches(o: Any, level: int, is_mapping: bool) -> None:
+            separator = "," + newline(level + 1)
+            pending = ("{" if is_mapping else "[") + newline(level + 1)
+            for batch in iter_batches(o, is_mapping):
+                if c_make_encoder is not None and leaf_types.issuperset(map(type, batch.values() if is_mapping else batch)):
+                    append(pending + "".join(leaf_encoder(level)(batch, level))[1:-1])
+                    pending = separator
+                else:
+                    pending = encode_items(batch.items() if is_mapping else batch, level, is_mapping, pending)
+                write("".join(parts))
+                parts.clear()
+            append(newline(level) + ("}" if is_mapping else "]"))
+        
+        def encode(o: Any, level: int) -> None:
+            if isinstance(o, (list, tuple)):
+                is_mapping = False
+            elif isinstance(o, Mapping):
+                is_mapping = True
+            else:
+                text = scalar_repr(o)
+                if text is None:
+                    raise TypeError(f"Object of type {o.__class__.__name__} is not JSON serializable")
+                append(text)
+                return
+            if not o:
+                append("{}" if is_mapping else "[]")
+                return
+            
+            batched = is_mapping and not isinstance(o, dict) or len(o) > chunk_size
+            if not batched and c_make_encoder is not None and leaf_types.issuperset(
+                    map(type, o.values() if is_mapping else o)):
+                text = "".join(leaf_encoder(level)(o, level))
+                append(text[0] + newline(level + 1) + text[1:-1] + newline(level) + text[-1])
+                return
+            
+            marker = id(o)
+            if marker in markers:
+                raise ValueError("Circular reference detected")
+            markers.add(marker)
+            if batched:
+                encode_batches(o, level, is_mapping)
+            else:
+                encode_items(o.items() if is_mapping else o, level, is_mapping,
+                             ("{" if is_mapping else "[") + newline(level + 1))
+                append(newline(level) + ("}" if is_mapping else "]"))
+            markers.discard(marker)
+        
+        encode(value, 0)
+        if parts:
+            write("".join(parts))
+
+
+class CompactJsonSerializer(JsonSerializer):
+    def __init__(self, use_orjson: bool = True):
+        self.use_orjson = use_orjson and orjson is not None
+    
+    def dump(self, value: Any, f: TextIO) -> None:
+        f.write(self.dumps(value))
+    
+    def dumps(self, value: Any) -> str:
+        if isinstance(value, ChunkedMapping):
+            value = value.materialize()
+        if self.use_orjson and not has_non_finite(value):
+            try:
+                return orjson.dumps(value, default=mapping_default, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            except TypeError:
+                pass
+        return json.dumps(value, separators=(",", ":"), default=mapping_default)
+    
+    def dumps_item(self, value: Any) -> str:
+        return self.dumps(value)
+    
+    def join_items(self, items: List[str]) -> str:
+        return "[" + ",".join(items) + "]"
\ No newline at end of file
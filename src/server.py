@@ -0,0 +1,107 @@
+import json
+import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from src.application import Application
+from src.batch import job_configuration
+
+
+class ProcessingService:
+    def __init__(self, application: Optional[Application] = None, work_dir: Optional[str] = None):
+        self.application = application or Application()
+        self.work_dir = work_dir
+        self.requests = 0
+        self.lock = threading.Lock()
+    
+    def handle(self, request: Dict[str, Any]) -> Dict[str, str]:
+        model, configs, model_format = self._validate(request)
+        with self.lock:
+            self.requests += 1
+        
+        with tempfile.TemporaryDirectory(dir=self.work_dir) as tmp_dir:
+            input_model = os.path.join(tmp_dir, f"model{model_format}")
+            with open(input_model, "w", encoding="utf-8") as f:
+                f.write(model)
+            input_config_paths = []
+            for idx, config in enumerate(configs):
+                path = os.path.join(tmp_dir, f"config_{idx}.json")
+                with open(path, "w", encoding="utf-8") as f:
+                    json.dump(config, f)
+                input_config_paths.append(path)
+            
+            config = job_configuration({
+                "input_model": input_model,
+                "input_config_paths": input_config_paths,
+                "output_dir": os.path.join(tmp_dir, "out")
+            })
+            self.application.run(config)
+            
+            artifacts = {}
+            for path in list(config.output_paths.values()) + config.output_config_paths:
+                with open(path, "r", encoding="utf-8") as f:
+                    artifacts[os.path.basename(path)] = f.read()
+            return artifacts
+    
+    def _validate(self, request: Any) -> Tuple[str, list, str]:
+        if not isinstance(request, dict):
+            raise ValueError("Request body must be a JSON object")
+        model = request.get("model")
+        if not isinstance(model, str):
+            raise ValueError("'model' must be the model document as a string")
+        configs = request.get("configs")
+        if not isinstance(configs, list) or len(configs) != 2:
+            raise ValueError("'configs' must be a list with the original and the patched config")
+        model_format = request.get("model_format", ".xml")
+        if not isinstance(model_format, str) or not model_format.startswith(".") or os.sep in model_format:
+            raise ValueError(f"Invalid model_format: {model_format!r}")
+        return model, configs, model_format
+
+
+class ProcessingRequestHandler(BaseHTTPRequestHandler):
+    server_version = "ModelProcessingServer/1"
+    
+    def do_GET(self) -> None:
+        if self.path != "/health":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        self._send_json(200, {"status": "ok", "requests": self.server.service.requests})
+    
+    def do_POST(self) -> None:
+        if self.path != "/process":
+            self._send_json(404, {"error": f"Unknown path: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length))
+            artifacts = self.server.service.handle(request)
+        except ValueError as e:
+            self._send_json(400, {"error": str(e)})
+        except Exception as e:
+            self._send_json(500, {"error": f"{type(e).__name__}: {e}"})
+        else:
+            self._send_json(200, {"artifacts": artifacts})
+    
+    def _send_json(self, status: int, body: Dict) -> None:
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class ProcessingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    
+    def __init__(self, address: Tuple[str, int], service: Optional[ProcessingService] = None):
+        super().__init__(address, ProcessingRequestHandler)
+        self.service = service or ProcessingService()
+
+
+def parse_address(address: str) -> Tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got {address!r}")
+    return host or "127.0.0.1", int(port)
\ No newline at end of file
@@ -0,0 +1,105 @@
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Set, Tuple
+from src.config import AppConfiguration
+from src.application import Application
+
+
+MODEL_STAGE = "model"
+CONFIGS_STAGE = "configs"
+
+
+@dataclass
+class WatchRun:
+    stages: Tuple[str, ...]
+    elapsed: float
+    error: Optional[Exception] = None
+    failed: Tuple[str, ...] = ()
+
+
+def file_state(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
+class PipelineWatcher:
+    def __init__(self, application: Application, config: Optional[AppConfiguration] = None,
+                 interval: float = 0.5, debounce: float = 0.3,
+                 on_run: Optional[Callable[[WatchRun], None]] = None):
+        if interval <= 0:
+            raise ValueError(f"interval must be positive, got {interval}")
+        if debounce < 0:
+            raise ValueError(f"debounce must not be negative, got {debounce}")
+        self.application = application
+        self.config = config or application.config
+        self.interval = interval
+        self.debounce = debounce
+        self.on_run = on_run
+        self.watched = self._watched_paths()
+        self.states = {path: file_state(path) for path in self.watched}
+        self.model = None
+        self.runs = 0
+        self.stop_event = threading.Event()
+    
+    def _watched_paths(self) -> Dict[str, str]:
+        watched = {path: CONFIGS_STAGE for path in self.config.input_config_paths}
+        watched[self.config.input_model] = MODEL_STAGE
+        return watched
+    
+    def poll(self) -> Set[str]:
+        changed = set()
+        for path, stage in self.watched.items():
+            state = file_state(path)
+            if state != self.states[path]:
+                self.states[path] = state
+                changed.add(stage)
+        return changed
+    
+    def run_stages(self, stages: Set[str]) -> WatchRun:
+        ordered = tuple(stage for stage in (MODEL_STAGE, CONFIGS_STAGE) if stage in stages)
+        started = time.perf_counter()
+        error = None
+        failed = []
+        for stage in ordered:
+            try:
+                os.makedirs(self.config.output_dir, exist_ok=True)
+                if stage == MODEL_STAGE:
+                    self.model = self.application.model_processor.process_model(self.config.input_model)
+                    self.application.generate_output_files(self.model, self.config)
+                else:
+                    self.application.process_configs(self.config)
+            except Exception as e:
+                error = error or e
+                failed.append(stage)
+        self.runs += 1
+        run = WatchRun(ordered, time.perf_counter() - started, error, tuple(failed))
+        if self.on_run:
+            self.on_run(run)
+        return run
+    
+    def watch(self, max_runs: Optional[int] = None) -> None:
+        self.stop_event.clear()
+        failed = set(self.run_stages({MODEL_STAGE, CONFIGS_STAGE}).failed)
+        pending = set()
+        last_change = 0.0
+        while not self.stop_event.is_set():
+            if max_runs is not None and self.runs >= max_runs:
+                break
+            changed = self.poll()
+            now = time.monotonic()
+            if changed:
+                pending |= changed | failed
+                last_change = now
+            if pending and now - last_change >= self.debounce:
+                stages, pending = pending, set()
+                failed = set(self.run_stages(stages).failed)
+                continue
+            self.stop_event.wait(min(self.interval, self.debounce) if pending else self.interval)
+    
+    def stop(self) -> None:
+        self.stop_event.set()
\ No newline at end of file
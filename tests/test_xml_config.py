@@ -0,0 +1,135 @@
+import io
+import random
+import sys
+import xml.etree.ElementTree as ET
+import pytest
+from benchmarks.synthetic import build_model
+from src.config import AppConfiguration
+from src.model import Builder, XmlConfigVisitor
+from src.output import XmlConfigOutputGenerator
+
+
+def reference_indent(elem: ET.Element, level: int = 0, indent_str: str = "  ") -> None:
+    i = "\n" + level * indent_str
+    if len(elem):
+        if not elem.text or not elem.text.strip():
+            elem.text = i + indent_str
+        last_idx = len(elem) - 1
+        for idx, subelem in enumerate(elem):
+            reference_indent(subelem, level + 1, indent_str)
+            subelem.tail = i if idx == last_idx else i + indent_str
+        if not elem.tail:
+            elem.tail = i
+    elif level and (not elem.tail or not elem.tail.strip()):
+        elem.tail = i
+
+
+def reference_output(model) -> bytes:
+    root = XmlConfigVisitor().generate(model)
+    reference_indent(root)
+    f = io.BytesIO()
+    ET.ElementTree(root).write(f, encoding="utf-8", xml_declaration=False, method="xml")
+    return f.getvalue()
+
+
+def generator_output(model) -> bytes:
+    generator = XmlConfigOutputGenerator()
+    root = XmlConfigVisitor().generate(model)
+    generator.indent(root)
+    f = io.StringIO()
+    generator.write(root, f)
+    return f.getvalue().encode("utf-8")
+
+
+def random_model(rng: random.Random, classes: int):
+    type_choices = ["string", "uint32", "", "a<b>&c", "значение", " ", "x\ny"]
+    builder = Builder()
+    builder.add_class("Root", True, "root")
+    names = ["Root"]
+    for idx in range(1, classes):
+        name = f"Class{idx}"
+        builder.add_class(name, False, "")
+        for attr_idx in range(rng.randrange(4)):
+            builder.add_attribute(name, f"attr{attr_idx}", rng.choice(type_choices))
+        parent = names[rng.randrange(max(0, len(names) - 5), len(names))] if rng.random() < 0.5 else rng.choice(names)
+        builder.add_relation(name, parent, "0..1", "1")
+        names.append(name)
+    for attr_idx in range(rng.randrange(3)):
+        builder.add_attribute("Root", f"attr{attr_idx}", rng.choice(type_choices))
+    return builder.build()
+
+
+@pytest.fixture
+def low_recursion_limit():
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(1000)
+    yield
+    sys.setrecursionlimit(limit)
+
+
+def test_deep_chain_does_not_recurse(low_recursion_limit):
+    depth = 100000
+    model = build_model(depth, fanout=1, attributes=0)
+    generator = XmlConfigOutputGenerator()
+    root = XmlConfigVisitor().generate(model)
+    
+    levels = 0
+    elem = root
+    while len(elem):
+        elem = elem[0]
+        levels += 1
+    assert levels == depth - 1
+    
+    f = io.StringIO()
+    generator.write(root, f)
+    text = f.getvalue()
+    assert text.startswith("<Root><Class1><Class2>")
+    assert f"<Class{depth - 1} /></Class{depth - 2}>" in text
+    assert text.endswith("</Class1></Root>")
+    
+    generator.indent(root, indent_str="")
+    assert elem.tail == "\n"
+    assert root.text == "\n"
+
+
+def test_wide_model_is_byte_identical():
+    model = build_model(1000000, fanout=1000000, attributes=0)
+    assert generator_output(model) == reference_output(model)
+
+
+def test_generate_writes_reference_output(tmp_path):
+    model = build_model(2000, fanout=3, attributes=2)
+    path = tmp_path / "config.xml"
+    XmlConfigOutputGenerator().generate(model, AppConfiguration(output_paths={XmlConfigOutputGenerator.key(): str(path)}))
+    assert path.read_bytes() == reference_output(model)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_random_models_are_byte_identical(seed):
+    rng = random.Random(seed)
+    model = random_model(rng, rng.randrange(1, 300))
+    assert generator_output(model) == reference_output(model)
+
+
+def test_write_serializes_attributes_like_element_tree():
+    root = ET.Element("a", {"x": "1"})
+    ET.SubElement(root, "b", {"y": "2"})
+    f = io.StringIO()
+    XmlConfigOutputGenerator().write(root, f)
+    assert f.getvalue() == ET.tostring(root, encoding="unicode")
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_attributes_are_byte_identical(seed):
+    rng = random.Random(seed)
+    values = ["1", "", "a<b>&c", 'say "hi"', "line\nbreak\r\ttab", "значение", "'single'"]
+    root = XmlConfigVisitor().generate(random_model(rng, rng.randrange(1, 200)))
+    reference_indent(root)
+    for elem in root.iter():
+        for idx in range(rng.randrange(3)):
+            elem.set(f"attr{idx}", rng.choice(values))
+    expected = io.BytesIO()
+    ET.ElementTree(root).write(expected, encoding="utf-8", xml_declaration=False, method="xml")
+    f = io.StringIO()
+    XmlConfigOutputGenerator().write(root, f)
+    assert f.getvalue().encode("utf-8") == expected.getvalue()
\ No newline at end of file